@@ -0,0 +1,49 @@
+import random
+import time
+import tracemalloc
+from typing import Callable
+
+NAMES = ["Koncert O2 arena", "Festival Sázava", "Veletrh PVA Letňany", "Hokej Sparta", "Inventura Albert",
+         "Firemní večírek", "Muzikál Kalich", "Fotbal Slavia"]
+LOCATIONS = ["O2 arena, Praha 9", "Sázava 12, Sázava", "PVA EXPO, Praha 9", "Fortuna arena, Praha 7",
+             "Hypermarket Chodov, Praha 4", "Karlín Forum, Praha 8"]
+POSITIONS = ["Stagehands - Pracovník", "Šatna - Obsluha", "Bar - Barman", "Úklid - Pracovník",
+             "Ochranka - Pořadatel", "Catering - Číšník"]
+
+
+def generate_rows(count: int = 1800, seed: int = 7) -> list[tuple[list[str], bool, str]]:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        day, hour = rng.randint(1, 28), rng.randint(5, 20)
+        occupied = rng.randint(0, 10)
+        # Cells are formatted per row so that, like scraped text, equal values are distinct str objects
+        cells = [
+            f"{rng.choice(NAMES)}",
+            f"{day}. {rng.randint(1, 12)}. 2025",
+            f"{hour:02d}:00 - {(hour + rng.randint(4, 10)) % 24:02d}:30",
+            f"{rng.choice(LOCATIONS)}",
+            f"{rng.choice(POSITIONS)}",
+            f"{occupied}/{occupied + rng.randint(0, 10)}",
+            "",
+        ]
+        rows.append((cells, i % 10 == 9, f"/react/position/{100000 + i}"))
+    return rows
+
+
+def measure_memory(build: Callable[[], object]) -> tuple[object, int]:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return result, sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def measure_time(action: Callable[[], object], repeat: int = 20) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - started_at)
+    return best
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Row parsing throughput of ShiftConverter on a board of shift rows
+
+    python -m benchmarks.converter_benchmark --rows 1800 --churn 0.1
+    python -m benchmarks.converter_benchmark --corpus captures/2025-09-15
+
+cold   - caches cleared before every pass, as on the first scrape after start
+warm   - the same board parsed again, as on a cycle where nothing changed
+churn  - the given share of rows changes occupancy between passes
+"""
+
+import argparse
+import json
+import random
+
+from benchmarks.common import generate_rows, measure_time
+from src.main.utils import FixtureCorpus, ShiftConverter
+
+
+def load_corpus_rows(path: str) -> list[tuple[list[str], bool, str]]:
+    corpus = FixtureCorpus(path)
+    rows = []
+    for page in corpus.list_pages:
+        extracted_rows = corpus.load_extracted_rows(page)
+        if extracted_rows is not None:
+            rows.extend((cells, bool(liquidating), href) for cells, liquidating, href in json.loads(extracted_rows)['rows'])
+    return rows
+
+
+def churn_rows(rows: list[tuple[list[str], bool, str]], share: float, seed: int) -> list[tuple[list[str], bool, str]]:
+    rng = random.Random(seed)
+    changed = []
+    for cells, liquidating, href in rows:
+        if rng.random() < share:
+            occupied, max_occupy = ShiftConverter._parse_occupancy(cells[5])
+            # Always a different occupancy, so the share of changed rows is the requested one
+            if max_occupy:
+                occupancy = f"{(occupied + rng.randint(1, max_occupy)) % (max_occupy + 1)}/{max_occupy}"
+            else:
+                occupancy = f"{occupied}/{max_occupy + 1}"
+            cells = cells[:5] + [occupancy] + cells[6:]
+        changed.append((cells, liquidating, href))
+    return changed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1800)
+    parser.add_argument("--corpus", help="fixture corpus directory recorded with SELENIUM_CAPTURE_DIR")
+    parser.add_argument("--churn", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = load_corpus_rows(args.corpus) if args.corpus else generate_rows(args.rows)
+    boards = [churn_rows(rows, args.churn, seed) for seed in range(args.repeat + 1)]
+
+    def cold() -> None:
+        ShiftConverter.clear_caches()
+        ShiftConverter.build_shift_rows(rows)
+
+    def churn() -> None:
+        churn.board = (churn.board + 1) % len(boards)
+        ShiftConverter.build_shift_rows(boards[churn.board])
+    churn.board = 0
+
+    results = [("cold", measure_time(cold, args.repeat))]
+    ShiftConverter.clear_caches()
+    ShiftConverter.build_shift_rows(rows)
+    results.append(("warm", measure_time(lambda: ShiftConverter.build_shift_rows(rows), args.repeat)))
+    ShiftConverter.clear_caches()
+    results.append(("churn", measure_time(churn, args.repeat)))
+
+    print(f"{'pass':<6} {'ms/board':>9} {'µs/row':>7} {'rows/s':>10}")
+    for name, seconds in results:
+        print(f"{name:<6} {seconds * 1000:>9.2f} {seconds / len(rows) * 1e6:>7.2f} {len(rows) / seconds:>10.0f}")
+    print(", ".join(f"{name} hits/misses={hits}/{misses}" for name, (hits, misses) in ShiftConverter.cache_stats().items()))
+
+
+if __name__ == "__main__":
+    main()
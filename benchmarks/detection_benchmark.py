@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+End-to-end detection latency and throughput against the local stand-in board
+
+    python -m benchmarks.stand_in_server --mutate-interval 5 --add 3 &
+    python -m benchmarks.detection_benchmark --mode http --duration 60
+    SHIFT_BOARD_BASE_URL=http://localhost:8080/react/position \\
+        python -m benchmarks.detection_benchmark --mode selenium --pool-size 2
+
+Latency is measured from the moment the server added a shift to the end of the cycle that reported it.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import aiohttp
+
+from benchmarks.stand_in_server import LIST_PATH, LOGIN_PATH, SESSION_COOKIE
+from src.main.clients import HttpShiftClient, SeleniumClient
+from src.main.constants import BASE_URL
+from src.main.schemas import ShiftEventType
+from src.main.utils import ShiftSnapshotStore
+
+
+async def login_cookies(url: str, login: str, password: str) -> list[dict]:
+    async with aiohttp.ClientSession() as session:
+        async with session.post(url + LOGIN_PATH, data={"email": login, "password": password},
+                                allow_redirects=False) as response:
+            return [{"name": SESSION_COOKIE, "value": response.cookies[SESSION_COOKIE].value}]
+
+
+async def board_events(url: str, since: float) -> dict:
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url + "/__board", params={"since": str(since)}) as response:
+            return await response.json()
+
+
+async def create_client(args: argparse.Namespace):
+    if args.mode == "http":
+        client = HttpShiftClient(base_url=args.url + LIST_PATH)
+        client.set_cookies(await login_cookies(args.url, args.login, args.password))
+        return client, client.parse_shifts
+    if BASE_URL != args.url + LIST_PATH:
+        raise SystemExit(f"Set SHIFT_BOARD_BASE_URL={args.url}{LIST_PATH} so Chrome is pointed at the stand-in board")
+    client = SeleniumClient(args.login, args.password, pool_size=args.pool_size, warm_standby=False,
+                            worker_options={"cookies_path": None}, watch_mode=args.mode == "watch")
+    await client.start_process()
+    return client, client.watch_shifts if args.mode == "watch" else client.parse_shifts
+
+
+async def run(args: argparse.Namespace) -> None:
+    client, fetch_shifts = await create_client(args)
+    store = ShiftSnapshotStore()
+    detected: dict[int, float] = dict()
+    cycle_seconds = []
+    started_at = time.time()
+    try:
+        while time.time() - started_at < args.duration:
+            cycle_started_at = time.perf_counter()
+            shifts = await fetch_shifts()
+            selenium = isinstance(client, SeleniumClient)
+            snapshot_diff = store.diff(shifts, client.changed_links if selenium else None)
+            store.commit(snapshot_diff)
+            if selenium:
+                client.acknowledge_changes()
+            for event in snapshot_diff.events:
+                if event.type == ShiftEventType.NEW:
+                    detected.setdefault(event.link, time.time())
+            cycle_seconds.append(time.perf_counter() - cycle_started_at)
+            await asyncio.sleep(args.interval)
+    finally:
+        if isinstance(client, HttpShiftClient):
+            await client.close()
+        else:
+            await client.close_driver()
+
+    board = await board_events(args.url, started_at)
+    added = {event["link"]: event["at"] for event in board["events"] if event["type"] == "new"}
+    latencies = sorted(detected[link] - at for link, at in added.items() if link in detected)
+    print(f"mode {args.mode}: {len(cycle_seconds)} cycles, avg {statistics.mean(cycle_seconds) * 1000:.1f} ms, "
+          f"max {max(cycle_seconds) * 1000:.1f} ms, {board['requests'] / args.duration:.1f} requests/s on the board")
+    print(f"new shifts: {len(added)} added, {len(latencies)} detected")
+    if latencies:
+        print(f"latency: p50 {statistics.median(latencies):.2f} s, "
+              f"p95 {latencies[int(len(latencies) * 0.95) - 1 if len(latencies) > 1 else 0]:.2f} s, "
+              f"max {latencies[-1]:.2f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8080")
+    parser.add_argument("--mode", choices=("http", "selenium", "watch"), default="http")
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--interval", type=float, default=1, help="pause between cycles in seconds")
+    parser.add_argument("--pool-size", type=int, default=1)
+    parser.add_argument("--login", default="bench@example.com")
+    parser.add_argument("--password", default="bench")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
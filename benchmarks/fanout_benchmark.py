@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Per-user fan-out cost of ShiftService.search for growing shift payloads, comparing the previous
+deepcopy and per-user filtering with the shared immutable shifts matched through SubscriptionIndex.
+The "no-copy" variant runs the same per-user filtering on shared shifts, so deepcopy against no-copy
+is the cost of copying alone and no-copy against shared is what the index saves on top.
+
+    python -m benchmarks.fanout_benchmark --users 500 --shifts 100
+"""
+
+import argparse
+import copy
+import random
+from dataclasses import replace
+
+from benchmarks.common import LOCATIONS, POSITIONS, generate_rows, measure_time
+from src.main.schemas import FilterBase, ListFieldBase, ShiftBase
+from src.main.utils import ShiftCollector, ShiftConverter, SubscriptionIndex
+
+CONNECTED_SHIFTS = (0, 4, 16)
+
+
+# The payload grows with connected shifts, which share the parent's location and position so matches stay the same
+def build_shifts(count: int, connected: int) -> list[ShiftBase]:
+    collector = ShiftCollector()
+    collector.add_page(ShiftConverter.build_shift_rows(generate_rows(count)))
+    return [
+        replace(shift, connected_shifts=[replace(shift, link=shift.link * 100 + i, connected_shifts=[])
+                                         for i in range(connected)])
+        for shift in collector.shifts
+    ]
+
+
+def build_user_filters(users: int, seed: int = 7) -> dict[int, list[FilterBase]]:
+    rng = random.Random(seed)
+    user_filters = dict()
+    for user_id in range(users):
+        white_list = FilterBase(is_black_list=False, is_and=False,
+                                locations=[ListFieldBase(value=value) for value in rng.sample(LOCATIONS, 2)])
+        black_list = FilterBase(is_black_list=True, is_and=False,
+                                positions=[ListFieldBase(value=rng.choice(POSITIONS))])
+        user_filters[user_id] = [white_list, black_list] if user_id % 4 else [FilterBase(), FilterBase()]
+    return user_filters
+
+
+# The per-user filtering search() did before the subscription index, kept here as the baseline
+def filter_shifts(shift_list: list[ShiftBase], shift_filter: FilterBase) -> list[ShiftBase]:
+    final_shift_list = list()
+    for shift in shift_list:
+        if shift_matches_filter(shift, shift_filter):
+            if len(filter_shifts(shift.connected_shifts, shift_filter)) != len(shift.connected_shifts):
+                continue
+            final_shift_list.append(shift)
+    return final_shift_list
+
+
+def shift_matches_filter(shift: ShiftBase, shift_filter: FilterBase) -> bool:
+    conditions = []
+    if shift_filter.longer:
+        conditions.append(shift_filter.longer < (shift.end - shift.start))
+    if shift_filter.shorter:
+        conditions.append(shift_filter.shorter > (shift.end - shift.start))
+    if shift_filter.companies:
+        conditions.append(shift.company and shift.company in [company.value for company in shift_filter.companies])
+    if shift_filter.locations:
+        conditions.append(shift.location in [location.value for location in shift_filter.locations])
+    if shift_filter.positions:
+        conditions.append(shift.position in [position.value for position in shift_filter.positions])
+
+    if not conditions:
+        return True
+    passed = all(conditions) if shift_filter.is_and else any(conditions)
+    return not passed if shift_filter.is_black_list else passed
+
+
+def fan_out_filtered(shifts: list[ShiftBase], user_filters: dict[int, list[FilterBase]], deep_copy: bool) -> int:
+    matched = 0
+    for filters in user_filters.values():
+        user_shifts = copy.deepcopy(shifts) if deep_copy else shifts
+        user_shifts = filter_shifts(user_shifts, filters[0])
+        user_shifts = filter_shifts(user_shifts, filters[1])
+        matched += len(user_shifts)
+    return matched
+
+
+def fan_out_deepcopy(shifts: list[ShiftBase], user_filters: dict[int, list[FilterBase]]) -> int:
+    return fan_out_filtered(shifts, user_filters, deep_copy=True)
+
+
+def fan_out_no_copy(shifts: list[ShiftBase], user_filters: dict[int, list[FilterBase]]) -> int:
+    return fan_out_filtered(shifts, user_filters, deep_copy=False)
+
+
+def fan_out_shared(shifts: list[ShiftBase], user_filters: dict[int, list[FilterBase]]) -> int:
+    matched_shifts = SubscriptionIndex(user_filters).match_shifts(shifts)
+    return sum(len(user_shifts) for user_shifts in matched_shifts.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--shifts", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    user_filters = build_user_filters(args.users)
+    print(f"{'variant':<10} {'connected':>10} {'matches':>8} {'total ms':>9} {'us/user':>8}")
+    for connected in CONNECTED_SHIFTS:
+        shifts = build_shifts(args.shifts, connected)
+        for variant, fan_out in (("deepcopy", fan_out_deepcopy), ("no-copy", fan_out_no_copy),
+                                 ("shared", fan_out_shared)):
+            matches = fan_out(shifts, user_filters)
+            seconds = measure_time(lambda: fan_out(shifts, user_filters), args.repeat)
+            print(f"{variant:<10} {connected:>10} {matches:>8} {seconds * 1000:>9.2f} "
+                  f"{seconds / args.users * 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Offline replay benchmark of the shift list and detail page extraction strategies
+
+    python -m benchmarks.scraper_benchmark --corpus captures/2025-09-15
+    python -m benchmarks.scraper_benchmark --write-corpus /tmp/synthetic
+    python -m benchmarks.scraper_benchmark --corpus captures/2025-10-01 --check-xhr
+
+A corpus is recorded by running the bot with SELENIUM_CAPTURE_DIR set. Without --corpus a synthetic
+1,800-row board is generated in a temporary directory.
+
+script - rows recorded from EXTRACT_SHIFT_ROWS_SCRIPT, only the Python side is measured
+soup   - BeautifulSoup over the recorded page source, the fallback used when the script fails
+
+--check-xhr compares the shifts parsed from the recorded board API payloads (a corpus recorded with
+SELENIUM_CAPTURE_XHR=true) with the rows the DOM showed on the same page, lists payload keys that no
+XHR_* alias covers and exits non-zero on any mismatch.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic_board import write_synthetic_corpus
+from src.main.clients.replay_shift_client import REPLAY_STRATEGIES, ReplayShiftClient
+from src.main.constants.selenium_constants import XHR_CONNECTED_KEYS, XHR_FIELD_ALIASES, XHR_LIST_KEYS
+from src.main.schemas.shift import ShiftBase
+from src.main.utils import FixtureCorpus, ShiftCollector, ShiftConverter
+
+KNOWN_XHR_KEYS = {key for aliases in XHR_FIELD_ALIASES.values() for key in aliases} | set(XHR_CONNECTED_KEYS)
+# The list page does not show the company, so it is left out of the comparison
+CHECKED_FIELDS = ("name", "start", "end", "location", "position", "occupied", "max_occupy")
+
+
+def run_strategy(corpus: FixtureCorpus, strategy: str, repeat: int, warm: bool) -> dict[str, float]:
+    client = ReplayShiftClient(corpus, strategy)
+    # Every pass reads the whole board instead of stopping early on an unchanged total
+    client.paginator.full_scan_interval = 1
+    best, shifts = float("inf"), []
+    for _ in range(repeat):
+        if not warm:
+            ShiftConverter.clear_caches()
+        started_at = time.perf_counter()
+        shifts = client.parse_shifts()
+        best = min(best, time.perf_counter() - started_at)
+
+    if not warm:
+        ShiftConverter.clear_caches()
+    tracemalloc.start()
+    client.parse_shifts()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    links = corpus.detail_links
+    started_at = time.perf_counter()
+    companies = {link: client.parse_company_name(link) for link in links}
+    detail_seconds = time.perf_counter() - started_at
+
+    rows = client.metrics.counter("rows") // (repeat + 1)
+    pages = client.metrics.snapshot().get("list_page_count", 0) // (repeat + 1)
+    return {
+        "shifts": len(shifts),
+        "rows_per_second": rows / best,
+        "ms_per_page": best / max(1, pages) * 1000,
+        "peak_kib": peak / 1024,
+        "ms_per_detail": detail_seconds / max(1, len(links)) * 1000,
+        "companies_matched": sum(companies[link] == corpus.recorded_company(link) for link in links),
+        "details": len(links),
+    }
+
+
+def _unknown_keys(items: list, unknown: set[str]) -> None:
+    for item in items:
+        if isinstance(item, dict):
+            unknown.update(key for key in item if key not in KNOWN_XHR_KEYS)
+            for key in XHR_CONNECTED_KEYS:
+                if isinstance(item.get(key), list):
+                    _unknown_keys(item[key], unknown)
+
+
+def _shift_diff(xhr_shift: ShiftBase, dom_shift: ShiftBase) -> list[str]:
+    diff = [f"{name}: {getattr(xhr_shift, name)!r} != {getattr(dom_shift, name)!r}"
+            for name in CHECKED_FIELDS if getattr(xhr_shift, name) != getattr(dom_shift, name)]
+    xhr_links = [c_shift.link for c_shift in xhr_shift.connected_shifts]
+    dom_links = [c_shift.link for c_shift in dom_shift.connected_shifts]
+    if xhr_links != dom_links:
+        diff.append(f"connected: {xhr_links} != {dom_links}")
+    return diff
+
+
+def check_xhr(corpus: FixtureCorpus) -> int:
+    mismatches, checked, unknown = 0, 0, set()
+    for page in corpus.list_pages:
+        payload, rows = corpus.load_xhr_payload(page), corpus.load_extracted_rows(page)
+        if payload is None or rows is None:
+            continue
+        checked += 1
+        payload = json.loads(payload)
+        items = ShiftConverter._json_value(payload, XHR_LIST_KEYS) if isinstance(payload, dict) else payload
+        _unknown_keys(items if isinstance(items, list) else [], unknown)
+
+        xhr_shifts, xhr_total = ShiftConverter.parse_shifts_payload(payload)
+        dom_page = ShiftConverter.parse_extracted_rows(rows, page)
+        collector = ShiftCollector()
+        collector.add_page(dom_page.rows)
+        dom_shifts = {shift.link: shift for shift in collector.shifts}
+        xhr_by_link = {shift.link: shift for shift in xhr_shifts}
+
+        problems = [f"total: {xhr_total!r} != {dom_page.total!r}"] if xhr_total != dom_page.total else []
+        problems += [f"link {link}: missing from the payload" for link in dom_shifts.keys() - xhr_by_link.keys()]
+        problems += [f"link {link}: not shown on the page" for link in xhr_by_link.keys() - dom_shifts.keys()]
+        for link in xhr_by_link.keys() & dom_shifts.keys():
+            problems += [f"link {link}: {diff}" for diff in _shift_diff(xhr_by_link[link], dom_shifts[link])]
+        print(f"page {page}: {len(xhr_shifts)} payload shifts, {len(dom_shifts)} page shifts, "
+              f"{len(problems)} mismatches")
+        for problem in problems[:20]:
+            print(f"    {problem}")
+        mismatches += len(problems)
+
+    if not checked:
+        print("No list page has both a recorded payload and rows, record the corpus with SELENIUM_CAPTURE_XHR=true")
+        return 1
+    if unknown:
+        print(f"Payload keys without an alias: {', '.join(sorted(unknown))}")
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="fixture corpus directory recorded with SELENIUM_CAPTURE_DIR")
+    parser.add_argument("--write-corpus", help="write the synthetic corpus to this directory and exit")
+    parser.add_argument("--strategy", choices=REPLAY_STRATEGIES, action="append")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warm", action="store_true", help="keep the converter caches between passes")
+    parser.add_argument("--check-xhr", action="store_true", help="check the XHR field mapping against the corpus")
+    args = parser.parse_args()
+
+    if args.check_xhr:
+        if not args.corpus:
+            parser.error("--check-xhr needs a recorded --corpus")
+        sys.exit(1 if check_xhr(FixtureCorpus(args.corpus)) else 0)
+
+    if args.write_corpus:
+        write_synthetic_corpus(args.write_corpus)
+        print(f"Synthetic corpus written to {args.write_corpus}")
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        corpus = FixtureCorpus(args.corpus) if args.corpus else write_synthetic_corpus(temp_dir)
+        print(f"corpus: {args.corpus or 'synthetic'}, {len(corpus.list_pages)} list pages, "
+              f"{len(corpus.detail_links)} detail pages, captured {corpus.manifest['captured_at']}")
+        print(f"{'strategy':<8} {'shifts':>7} {'rows/s':>10} {'ms/page':>8} {'peak KiB':>9} {'ms/detail':>10} {'companies':>10}")
+        for strategy in args.strategy or REPLAY_STRATEGIES:
+            result = run_strategy(corpus, strategy, args.repeat, args.warm)
+            print(f"{strategy:<8} {result['shifts']:>7} {result['rows_per_second']:>10.0f} "
+                  f"{result['ms_per_page']:>8.2f} {result['peak_kib']:>9.1f} {result['ms_per_detail']:>10.2f} "
+                  f"{result['companies_matched']:>4}/{result['details']:<5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Memory per snapshot and set build time of ShiftBase compared with the previous plain dataclass
+
+    python -m benchmarks.shift_base_benchmark --shifts 1800
+"""
+
+import argparse
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from benchmarks.common import generate_rows, measure_memory, measure_time
+from src.main.schemas import ShiftBase
+from src.main.utils import ShiftConverter
+
+
+@dataclass(init=True)
+class LegacyShiftBase:
+    name: Optional[str] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    location: Optional[str] = None
+    company: Optional[str] = None
+    occupied: Optional[int] = None
+    max_occupy: Optional[int] = None
+    link: int = None
+    position: str = None
+    is_bind: bool = False
+    connected_shifts: list['LegacyShiftBase'] = field(default_factory=list)
+
+    def __hash__(self) -> int:
+        connected_shifts_hash = list()
+        for c_shift in self.connected_shifts:
+            connected_shifts_hash.append(c_shift.__hash__())
+        return hash(
+            (self.name, self.start, self.end, self.location, self.company, self.max_occupy, self.link, *connected_shifts_hash)
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LegacyShiftBase):
+            return False
+        return (self.name == other.name and
+                self.start == other.start and
+                self.end == other.end and
+                self.location == other.location and
+                self.company == other.company and
+                self.max_occupy == other.max_occupy and
+                self.link == other.link and
+                set(self.connected_shifts) - set(other.connected_shifts)) == set()
+
+
+def fresh(value: str) -> str:
+    return (value + " ")[:-1]
+
+
+# Parsing happens outside the measured builds, so the converter caches are not counted against either variant
+def parse_rows(rows: list[tuple[list[str], bool, str]]) -> list[tuple]:
+    parsed = []
+    for cells, liquidating, href in rows:
+        start, end = ShiftConverter._parse_datetime(cells[1], cells[2])
+        occupied, max_occupy = ShiftConverter._parse_occupancy(cells[5])
+        parsed.append((cells[0], start, end, cells[3], cells[4], occupied, max_occupy,
+                       ShiftConverter.parse_shift_link(href), liquidating))
+    ShiftConverter.clear_caches()
+    return parsed
+
+
+def build_legacy(parsed: list[tuple]) -> list[LegacyShiftBase]:
+    shifts: dict[int, LegacyShiftBase] = dict()
+    previous = None
+    for name, start, end, location, position, occupied, max_occupy, link, liquidating in parsed:
+        shift = LegacyShiftBase(name=fresh(name), start=start, end=end, location=fresh(location),
+                                position=fresh(position), occupied=occupied, max_occupy=max_occupy, link=link)
+        if liquidating and previous:
+            previous.connected_shifts.append(shift)
+        else:
+            shifts[shift.link] = previous = shift
+    return list(shifts.values())
+
+
+def build_current(parsed: list[tuple]) -> list[ShiftBase]:
+    groups: list[tuple[tuple, list[ShiftBase]]] = []
+    for name, start, end, location, position, occupied, max_occupy, link, liquidating in parsed:
+        if liquidating and groups:
+            groups[-1][1].append(ShiftBase(name=fresh(name), start=start, end=end, location=fresh(location),
+                                           position=fresh(position), occupied=occupied, max_occupy=max_occupy,
+                                           link=link))
+        else:
+            groups.append(((name, start, end, location, position, occupied, max_occupy, link), []))
+    shifts: dict[int, ShiftBase] = dict()
+    for (name, start, end, location, position, occupied, max_occupy, link), connected in groups:
+        shifts[link] = ShiftBase(name=fresh(name), start=start, end=end, location=fresh(location),
+                                 position=fresh(position), occupied=occupied, max_occupy=max_occupy, link=link,
+                                 connected_shifts=connected)
+    return list(shifts.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shifts", type=int, default=1800)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    parsed = parse_rows(generate_rows(args.shifts))
+    print(f"{'variant':<10} {'shifts':>7} {'KiB':>9} {'B/shift':>8} {'set() ms':>9} {'lookup ms':>10}")
+    for variant, build in (("legacy", build_legacy), ("current", build_current)):
+        shifts, size = measure_memory(lambda: build(parsed))
+        set_seconds = measure_time(lambda: set(shifts), args.repeat)
+        shift_set = set(shifts)
+        lookup_seconds = measure_time(lambda: all(shift in shift_set for shift in shifts), args.repeat)
+        print(f"{variant:<10} {len(shifts):>7} {size / 1024:>9.1f} {size / len(shifts):>8.0f} "
+              f"{set_seconds * 1000:>9.3f} {lookup_seconds * 1000:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the shift board, for end-to-end scraper load tests
+
+    python -m benchmarks.stand_in_server --shifts 1800 --mutate-interval 5 --add 3 --remove 2 --change 5
+    SHIFT_BOARD_BASE_URL=http://localhost:8080/react/position python main.py
+
+Serves the login form, the paginated position list (?page=N&limit=200), detail pages with the company
+span at COMPANY_NAME_XPATH and liquidating connected rows. The board mutates on a schedule and every
+change is logged with its timestamp at /__board, so a client can measure its detection latency.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import secrets
+import time
+
+from aiohttp import web
+
+from benchmarks.common import generate_rows
+from benchmarks.synthetic_board import COMPANIES, render_detail_page, render_list_page, render_login_page
+
+LIST_PATH = "/react/position"
+LOGIN_PATH = "/react/login"
+SESSION_COOKIE = "session"
+
+
+class ShiftBoard:
+
+    def __init__(self, size: int, seed: int = 7):
+        self._rng = random.Random(seed)
+        self.rows = generate_rows(size, seed)
+        self.next_link = 100000 + size
+        self.events: list[dict] = []
+
+    @staticmethod
+    def link_of(row: tuple[list[str], bool, str]) -> int:
+        return int(row[2].rsplit("/", 1)[-1])
+
+    def company_of(self, link: int) -> str:
+        return COMPANIES[link % len(COMPANIES)]
+
+    def _record(self, event_type: str, link: int) -> None:
+        self.events.append({"type": event_type, "link": link, "at": time.time()})
+
+    def add(self, count: int) -> None:
+        for _ in range(count):
+            cells, _, _ = self.rows[self._rng.randrange(len(self.rows))]
+            link = self.next_link
+            self.next_link += 1
+            index = self._rng.randrange(len(self.rows) + 1)
+            while index < len(self.rows) and self.rows[index][1]:
+                index += 1
+            self.rows.insert(index, (list(cells), False, f"/react/position/{link}"))
+            self._record("new", link)
+
+    def remove(self, count: int) -> None:
+        for _ in range(min(count, len(self.rows) - 1)):
+            index = self._rng.randrange(len(self.rows))
+            if self.rows[index][1]:
+                continue
+            link = self.link_of(self.rows.pop(index))
+            # Liquidating rows belong to the shift above them and go with it
+            while index < len(self.rows) and self.rows[index][1]:
+                self.rows.pop(index)
+            self._record("removed", link)
+
+    def change(self, count: int) -> None:
+        for _ in range(count):
+            index = self._rng.randrange(len(self.rows))
+            cells, liquidating, href = self.rows[index]
+            max_occupy = int(cells[5].split("/")[1])
+            cells = cells[:5] + [f"{self._rng.randint(0, max_occupy)}/{max_occupy}"] + cells[6:]
+            self.rows[index] = (cells, liquidating, href)
+            self._record("changed", self.link_of(self.rows[index]))
+
+
+class StandInServer:
+
+    def __init__(self, board: ShiftBoard, latency: float = 0, session_ttl: float | None = None):
+        self.board = board
+        self.latency = latency
+        self.session_ttl = session_ttl
+        self._sessions: dict[str, float] = dict()
+        self.requests = 0
+
+    def _authenticated(self, request: web.Request) -> bool:
+        created_at = self._sessions.get(request.cookies.get(SESSION_COOKIE, ""))
+        if created_at is None:
+            return False
+        return self.session_ttl is None or time.time() - created_at < self.session_ttl
+
+    async def _delay(self) -> None:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def list_page(self, request: web.Request) -> web.Response:
+        await self._delay()
+        if not self._authenticated(request):
+            return web.Response(text=render_login_page(LOGIN_PATH), content_type="text/html")
+        limit = int(request.query.get("limit", 200))
+        page = max(1, int(request.query.get("page", 1)))
+        rows = self.board.rows[(page - 1) * limit:page * limit]
+        return web.Response(text=render_list_page(rows, page, len(self.board.rows)), content_type="text/html")
+
+    async def detail_page(self, request: web.Request) -> web.Response:
+        await self._delay()
+        if not self._authenticated(request):
+            return web.Response(text=render_login_page(LOGIN_PATH), content_type="text/html")
+        company = self.board.company_of(int(request.match_info["link"]))
+        return web.Response(text=render_detail_page(company), content_type="text/html")
+
+    async def login(self, request: web.Request) -> web.Response:
+        await self._delay()
+        token = secrets.token_hex(16)
+        self._sessions[token] = time.time()
+        response = web.HTTPFound(LIST_PATH)
+        response.set_cookie(SESSION_COOKIE, token)
+        return response
+
+    async def board_state(self, request: web.Request) -> web.Response:
+        since = float(request.query.get("since", 0))
+        return web.json_response({
+            "shifts": len(self.board.rows),
+            "pages": math.ceil(len(self.board.rows) / 200),
+            "requests": self.requests,
+            "events": [event for event in self.board.events if event["at"] > since],
+        })
+
+    def application(self) -> web.Application:
+        app = web.Application()
+        app.add_routes([
+            web.get(LIST_PATH, self.list_page),
+            web.get(LIST_PATH + "/{link:\\d+}", self.detail_page),
+            web.post(LOGIN_PATH, self.login),
+            web.get("/__board", self.board_state),
+        ])
+        return app
+
+
+async def mutate_board(board: ShiftBoard, interval: float, add: int, remove: int, change: int) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        board.add(add)
+        board.remove(remove)
+        board.change(change)
+
+
+async def serve(args: argparse.Namespace) -> None:
+    board = ShiftBoard(args.shifts)
+    server = StandInServer(board, args.latency_ms / 1000, args.session_ttl)
+    runner = web.AppRunner(server.application())
+    await runner.setup()
+    await web.TCPSite(runner, args.host, args.port).start()
+    print(f"Serving {len(board.rows)} shifts at http://{args.host}:{args.port}{LIST_PATH}")
+    if args.mutate_interval:
+        await mutate_board(board, args.mutate_interval, args.add, args.remove, args.change)
+    else:
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--shifts", type=int, default=1800)
+    parser.add_argument("--mutate-interval", type=float, default=0, help="seconds between board changes, 0 disables")
+    parser.add_argument("--add", type=int, default=1)
+    parser.add_argument("--remove", type=int, default=1)
+    parser.add_argument("--change", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=0, help="delay added to every page request")
+    parser.add_argument("--session-ttl", type=float, help="seconds after which sessions expire")
+    asyncio.run(serve(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import html
+import json
+import math
+
+from src.main.constants import SHIFTS_PAGE_LIMIT
+from src.main.utils import FixtureCorpus
+
+from benchmarks.common import generate_rows
+
+COMPANIES = ["Sinch Events s.r.o.", "Stage Crew CZ", "Arena Services a.s.", "Gastro Team Praha"]
+
+
+def render_list_page(rows: list[tuple[list[str], bool, str]], page: int, total: int) -> str:
+    body = []
+    for cells, liquidating, href in rows:
+        icon = '<svg class="jss42 jss44"></svg>' if liquidating else ''
+        cells_html = [f'<td class="MuiTableCell-root">{html.escape(cell)}</td>' for cell in cells[:-1]]
+        cells_html.append(f'<td class="MuiTableCell-root">{html.escape(cells[-1])}{icon}</td>')
+        body.append(f'<tr class="MuiTableRow-root MuiTableRow-hover">{"".join(cells_html)}</tr>')
+        body.append(f'<tr class="MuiTableRow-root"><td colspan="7"><a href="{href}">Detail</a></td></tr>')
+    body.append('<tr class="MuiTableRow-root MuiTableRow-footer"><td colspan="7"></td></tr>')
+
+    first = (page - 1) * SHIFTS_PAGE_LIMIT + 1
+    caption = f"{first}–{first + len(rows) - 1} z {total}" if rows else f"0–0 z {total}"
+    return (
+        '<html><head><title>Pozice</title><script>window.__SESSION__ = "token";</script></head><body>'
+        '<div id="toolbar-portal-top"><aside><div><div><div><div><div><button>Filtr</button>'
+        '</div></div></div></div></div></aside></div>'
+        '<div id="react-mount-point"><main><table class="MuiTable-root"><tbody>'
+        + "".join(body) +
+        f'</tbody></table><p class="MuiTablePagination-displayedRows">{caption}</p></main></div></body></html>'
+    )
+
+
+def render_detail_page(company: str) -> str:
+    return (
+        '<html><body><div id="react-mount-point"><main><slot></slot><slot><div><div></div><div><div><div><div>'
+        '<div><div><div><ul></ul><ul></ul><ul><li></li><li><div><div></div><div><div>'
+        f'<span>{html.escape(company)}</span>'
+        '</div></div></div></li></ul></div></div></div></div></div></div></div></div></slot></main></div>'
+        '</body></html>'
+    )
+
+
+def extract_rows_json(rows: list[tuple[list[str], bool, str]], page: int, total: int) -> str:
+    first = (page - 1) * SHIFTS_PAGE_LIMIT + 1
+    caption = f"{first}–{first + len(rows) - 1} z {total}" if rows else f"0–0 z {total}"
+    return json.dumps({"rows": [[cells, liquidating, href] for cells, liquidating, href in rows], "total": caption})
+
+
+def write_synthetic_corpus(path: str, row_count: int = 1800, detail_count: int = 50) -> FixtureCorpus:
+    corpus = FixtureCorpus(path)
+    rows = generate_rows(row_count)
+    for page in range(1, math.ceil(row_count / SHIFTS_PAGE_LIMIT) + 1):
+        page_rows = rows[(page - 1) * SHIFTS_PAGE_LIMIT:page * SHIFTS_PAGE_LIMIT]
+        corpus.save_list_page(page, render_list_page(page_rows, page, row_count),
+                              extract_rows_json(page_rows, page, row_count))
+    for i, (_, _, href) in enumerate(rows[:detail_count]):
+        company = COMPANIES[i % len(COMPANIES)]
+        corpus.save_detail_page(int(href.rsplit("/", 1)[-1]), render_detail_page(company), company)
+    return corpus
+
+
+def render_login_page(action: str) -> str:
+    return (
+        f'<html><body><form method="post" action="{action}">'
+        '<input id="UserEmail" name="email" type="email">'
+        '<input id="UserPassword" name="password" type="password">'
+        '<button class="theme-main-button big-btn full-btn" type="submit">Přihlásit</button>'
+        '</form></body></html>'
+    )
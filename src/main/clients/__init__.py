@@ -1 +1,3 @@
 from .selenium_client import SeleniumClient
+from .http_shift_client import HttpShiftClient
+from .replay_shift_client import ReplayShiftClient
@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import aiohttp
+
+from src.main.constants import BASE_URL, LOGIN_FORM_MARKER, SHIFTS_PAGE_QUERY
+from src.main.schemas import ShiftBase, ShiftPage
+from src.main.utils import ShiftConverter, ShiftPaginator, Metrics
+from src.main.exceptions.http_exceptions import (
+    HttpFetchException,
+    HttpSessionExpiredException,
+    HttpUnrenderedPageException
+)
+
+USER_AGENT = ("Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36")
+
+
+class HttpShiftClient:
+    def __init__(self, base_url: str = BASE_URL, concurrency: int = 3, timeout: float = 15):
+        self.base_url = base_url
+        self.concurrency = max(1, concurrency)
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session: aiohttp.ClientSession | None = None
+        self._cookie_header: str | None = None
+        self.metrics = Metrics("http_shift_client")
+        self.paginator = ShiftPaginator()
+
+    @property
+    def has_session(self) -> bool:
+        return self._cookie_header is not None
+
+    def set_cookies(self, cookies: list[dict]) -> None:
+        self._cookie_header = "; ".join(f"{cookie['name']}={cookie['value']}" for cookie in cookies)
+
+    def clear_cookies(self) -> None:
+        self._cookie_header = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency, ttl_dns_cache=300),
+                timeout=self._timeout,
+                headers={'User-Agent': USER_AGENT}
+            )
+        return self._session
+
+    async def fetch_page_html(self, page: int) -> str:
+        if not self._cookie_header:
+            raise HttpSessionExpiredException("No session cookies were provided")
+
+        start_time = time.perf_counter()
+        try:
+            async with self._get_session().get(
+                    self.base_url + SHIFTS_PAGE_QUERY.format(page=page),
+                    headers={'Cookie': self._cookie_header}
+            ) as response:
+                html = await response.text()
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.metrics.increment("errors")
+            raise HttpFetchException(f"Failed to fetch shifts page {page}: {str(e)}")
+
+        self.metrics.observe("page", time.perf_counter() - start_time)
+        self.metrics.increment("bytes", len(html))
+
+        if status in (401, 403) or LOGIN_FORM_MARKER in html:
+            self.metrics.increment("session_expired")
+            raise HttpSessionExpiredException(f"Shifts page {page} returned the login form")
+        if status >= 400:
+            self.metrics.increment("errors")
+            raise HttpFetchException(f"Shifts page {page} returned HTTP {status}")
+        return html
+
+    async def parse_shifts_page(self, page: int) -> ShiftPage:
+        html = await self.fetch_page_html(page)
+        shift_page = await asyncio.to_thread(ShiftConverter.parse_shift_page, html, page)
+        # An empty board still renders its "0–0 z 0" caption, a page without rows and total is the bare
+        # client-side shell (or a login redirect) and must not pass for an empty board
+        if not shift_page.rows and shift_page.total is None:
+            self.metrics.increment("unrendered_pages")
+            raise HttpUnrenderedPageException(f"Shifts page {page} has neither shift rows nor a total")
+        return shift_page
+
+    async def parse_shifts(self) -> list[ShiftBase]:
+        return await self.paginator.run(self.parse_shifts_page, concurrency=self.concurrency)
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,41 @@
+import time
+
+from src.main.schemas import ShiftBase, ShiftPage
+from src.main.utils import FixtureCorpus, ShiftConverter, ShiftPaginator, Metrics
+
+REPLAY_STRATEGIES = ("script", "soup")
+
+
+class ReplayShiftClient:
+    def __init__(self, corpus: FixtureCorpus | str, strategy: str = "script"):
+        if strategy not in REPLAY_STRATEGIES:
+            raise ValueError(f"Unknown extraction strategy {strategy}, expected one of {REPLAY_STRATEGIES}")
+        self.corpus = corpus if isinstance(corpus, FixtureCorpus) else FixtureCorpus(corpus)
+        self.strategy = strategy
+        self.metrics = Metrics(f"replay_{strategy}")
+        self.paginator = ShiftPaginator()
+
+    def parse_shifts_page(self, page: int) -> ShiftPage:
+        started_at = time.perf_counter()
+        extracted_rows = self.corpus.load_extracted_rows(page) if self.strategy == "script" else None
+        if extracted_rows is not None:
+            shift_page = ShiftConverter.parse_extracted_rows(extracted_rows, page)
+        else:
+            html = self.corpus.load_list_page(page)
+            shift_page = ShiftConverter.parse_shift_page(html, page) if html else ShiftPage(page=page)
+        self.metrics.observe("list_page", time.perf_counter() - started_at)
+        self.metrics.increment("rows", len(shift_page.rows))
+        return shift_page
+
+    def parse_shifts(self) -> list[ShiftBase]:
+        self.paginator.begin()
+        while pages := self.paginator.next_pages():
+            self.paginator.add_pages([self.parse_shifts_page(page) for page in pages])
+        return self.paginator.finish()
+
+    def parse_company_name(self, link: int) -> str | None:
+        started_at = time.perf_counter()
+        html = self.corpus.load_detail_page(link)
+        company_name = ShiftConverter.parse_company_name(html) if html else None
+        self.metrics.observe("detail_page", time.perf_counter() - started_at)
+        return company_name
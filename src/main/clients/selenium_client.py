@@ -1,20 +1,51 @@
 import asyncio
+import base64
+import json
+import logging
+import math
 import multiprocessing
+import os
+import queue
+import re
 import time
 from typing import Any
 
-from bs4 import BeautifulSoup
 from selenium import webdriver
+from selenium.common.exceptions import NoSuchWindowException, TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.remote_connection import ChromeRemoteConnection
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
 from webdriver_manager.chrome import ChromeDriverManager
 
-from src.main.constants import BASE_URL
-from src.main.schemas import ShiftBase
-from src.main.utils import ShiftConverter
+from src.main.clients.http_shift_client import HttpShiftClient
+from src.main.constants import (
+    BASE_URL,
+    COMPANY_NAME_XPATH,
+    DEFAULT_BLOCKED_URL_PATTERNS,
+    DRAIN_SHIFT_WATCH_SCRIPT,
+    INSTALL_SHIFT_WATCH_SCRIPT,
+    MAX_SHIFT_PAGES,
+    SHIFTS_PAGE_LIMIT,
+    PAGE_STATS_SCRIPT,
+    EXTRACT_SHIFT_ROWS_SCRIPT,
+    SHIFTS_PAGE_URL,
+    TOOLBAR_XPATH,
+    XHR_SHIFTS_URL_PATTERN
+)
+from src.main.schemas import ShiftBase, ShiftPage, ShiftPageDelta
+from src.main.utils import (
+    FixtureCorpus,
+    ShiftConverter,
+    ShiftCollector,
+    ShiftPaginator,
+    Metrics,
+    PageDeltaDecoder,
+    PageDeltaEncoder
+)
 from src.main.exceptions.selenium_exceptions import (
     SeleniumDriverCreationException,
     SeleniumDockerConnectionException,
@@ -28,19 +59,24 @@ from src.main.exceptions.selenium_exceptions import (
     SeleniumCommandTimeoutException,
     SeleniumWebDriverNotReadyException
 )
+from src.main.exceptions.http_exceptions import (
+    HttpBaseException,
+    HttpFetchException,
+    HttpSessionExpiredException
+)
+
+READY_TASK_ID = 'ready'
+WORKER_IDLE_TIMEOUT = 30
 
 
 def is_running_in_docker() -> bool:
     return True
 
 
-def get_chrome_options_for_environment() -> Options:
+def get_chrome_options_for_environment(capture_network: bool = False) -> Options:
     chrome_options = Options()
     chrome_options.add_argument("--disable-extensions")
     chrome_options.add_argument("--disable-plugins")
-    chrome_options.add_argument("--disable-images")
-    chrome_options.add_argument("--disable-javascript")
-    chrome_options.add_argument("--disable-css")
     chrome_options.add_argument("--disable-web-security")
     chrome_options.add_argument("--allow-running-insecure-content")
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
@@ -74,6 +110,10 @@ def get_chrome_options_for_environment() -> Options:
     chrome_options.add_argument("--max_old_space_size=4096")
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    chrome_options.page_load_strategy = 'eager'
+    if capture_network:
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
     
     if is_running_in_docker():
         chrome_options.add_argument("--no-sandbox")
@@ -87,88 +127,170 @@ def get_chrome_options_for_environment() -> Options:
     return chrome_options
 
 
+def get_blocked_url_patterns(blocked_url_patterns: list[str] | None = None,
+                             allowed_url_patterns: list[str] | None = None) -> list[str]:
+    blocked = DEFAULT_BLOCKED_URL_PATTERNS if blocked_url_patterns is None else blocked_url_patterns
+    allowed = set(allowed_url_patterns or [])
+    return [pattern for pattern in blocked if pattern not in allowed]
+
+
+def execute_cdp(driver: webdriver.Remote, cmd: str, params: dict | None = None) -> dict:
+    if hasattr(driver, 'execute_cdp_cmd'):
+        return driver.execute_cdp_cmd(cmd, params or {})
+    # Remote drivers get the Chrome-specific endpoint from the ChromeRemoteConnection they are created with
+    return driver.execute('executeCdpCommand', {'cmd': cmd, 'params': params or {}})['value']
+
+
+def get_browser_log(driver: webdriver.Remote, log_type: str) -> list[dict]:
+    if hasattr(driver, 'get_log'):
+        return driver.get_log(log_type)
+    return driver.execute(Command.GET_LOG, {'type': log_type})['value']
+
+
+def _execute_command(selenium_client: 'SeleniumClientInner', command: dict, page_deltas: PageDeltaEncoder) -> Any:
+    if command['type'] == 'parse_shifts':
+        return selenium_client.parse_shifts()
+    elif command['type'] == 'parse_shifts_page':
+        return page_deltas.encode(selenium_client.parse_shifts_page(command['page']), command.get('since'))
+    elif command['type'] == 'watch_shifts_page':
+        shift_page = selenium_client.watch_shifts_page(command['page'], command.get('reload', False))
+        return page_deltas.encode(shift_page, command.get('since')) if shift_page else None
+    elif command['type'] == 'unwatch_shifts_page':
+        return selenium_client.unwatch_shifts_page(command['page'])
+    elif command['type'] == 'export_cookies':
+        return selenium_client.export_cookies()
+    elif command['type'] == 'refresh_session':
+        return selenium_client.refresh_session()
+    elif command['type'] == 'parse_company_name':
+        link = command.get('link')
+        if link is None:
+            raise SeleniumCommandException(command['type'], "Link is required for company name parsing")
+        return selenium_client.parse_company_name(link)
+    raise SeleniumCommandException(command['type'], f"Unknown command: {command['type']}")
+
+
 def selenium_process_runner(login: str,
                             password: str,
                             command_queue: multiprocessing.Queue,
-                            result_queue: multiprocessing.Queue,):
+                            result_queue: multiprocessing.Queue,
+                            worker_id: int = 0,
+                            cookies: list[dict] | None = None,
+                            worker_options: dict | None = None):
     try:
-        selenium_client = SeleniumClientInner(login, password)
+        selenium_client = SeleniumClientInner(login, password, **(worker_options or {}))
+        page_deltas = PageDeltaEncoder(worker_id)
         
         try:
             selenium_client.create_driver()
         except Exception as e:
             raise SeleniumDriverCreationException(f"Failed to create driver in process: {str(e)}")
         
-        try:
-            selenium_client.login()
-        except Exception as e:
-            raise SeleniumLoginException(f"Login failed in process: {str(e)}")
+        cookies = cookies or selenium_client.load_cookies()
+        if not cookies or not selenium_client.login_with_cookies(cookies):
+            try:
+                selenium_client.login()
+            except Exception as e:
+                raise SeleniumLoginException(f"Login failed in process: {str(e)}")
         
         result_queue.put({
             'type': 'ready',
-            'data': 'Selenium process is ready'
+            'data': selenium_client.export_cookies(),
+            'worker_id': worker_id
         })
 
         while True:
             try:
-                if not command_queue.empty():
-                    command = command_queue.get_nowait()
-
-                    if command['type'] == 'shutdown':
-                        selenium_client.close_client()
-                        break
-                    elif command['type'] == 'parse_shifts':
-                        shifts = selenium_client.parse_shifts()
-                        result_queue.put({
-                            'type': 'success',
-                            'data': shifts,
-                            'task_id': command.get('task_id')
-                        })
-                    elif command['type'] == 'parse_company_name':
-                        link = command.get('link')
-                        if link is None:
-                            result_queue.put({
-                                'type': 'error',
-                                'data': 'Link is required for company name parsing',
-                                'task_id': command.get('task_id')
-                            })
-                        else:
-                            company_name = selenium_client.parse_company_name(link)
-                            result_queue.put({
-                                'type': 'success',
-                                'data': company_name,
-                                'task_id': command.get('task_id')
-                            })
-                time.sleep(0.1)
-            except Exception as e:
+                command = command_queue.get(timeout=WORKER_IDLE_TIMEOUT)
+            except queue.Empty:
+                parent = multiprocessing.parent_process()
+                if parent is not None and not parent.is_alive():
+                    selenium_client.close_client()
+                    break
+                continue
+
+            if command is None or command['type'] == 'shutdown':
+                selenium_client.close_client()
+                break
+
+            received_at = time.time()
+            timing = {'queued': received_at - command.get('sent_at', received_at)}
+
+            deadline = command.get('deadline')
+            if deadline is not None and received_at > deadline:
                 result_queue.put({
                     'type': 'error',
-                    'data': str(e)
+                    'data': f"Command expired {received_at - deadline:.2f} seconds before it was picked up",
+                    'command_type': command['type'],
+                    'task_id': command.get('task_id'),
+                    'timing': timing
                 })
-                time.sleep(1)
+                continue
+
+            try:
+                data = _execute_command(selenium_client, command, page_deltas)
+                result = {
+                    'type': 'success',
+                    'data': data
+                }
+            except Exception as e:
+                result = {
+                    'type': 'error',
+                    'data': str(e),
+                    'command_type': command['type']
+                }
+
+            timing['elapsed'] = time.time() - received_at
+            result['task_id'] = command.get('task_id')
+            result['timing'] = timing
+            result['page_stats'] = selenium_client.pop_page_stats()
+            result_queue.put(result)
 
     except Exception as e:
         result_queue.put({
             'type': 'fatal_error',
-            'data': str(e)
+            'data': str(e),
+            'worker_id': worker_id
         })
 
 
 class SeleniumClientInner:
 
-    def __init__(self, login: str, password: str):
+    def __init__(self,
+                 login: str,
+                 password: str,
+                 use_script_extraction: bool = True,
+                 cookies_path: str | None = None,
+                 blocked_url_patterns: list[str] | None = None,
+                 capture_xhr: bool = False,
+                 xhr_url_pattern: str = XHR_SHIFTS_URL_PATTERN,
+                 xhr_timeout: float = 5,
+                 xhr_max_misses: int = 3,
+                 capture_dir: str | None = None):
         self.driver = None
         self.email = login
         self.password = password
+        self.cookies_path = cookies_path
+        self.blocked_url_patterns = get_blocked_url_patterns() if blocked_url_patterns is None else blocked_url_patterns
+        self._page_stats: list[dict] = []
+        self.use_script_extraction = use_script_extraction
+        self.capture_xhr = capture_xhr
+        self.xhr_url_pattern = re.compile(xhr_url_pattern)
+        self.xhr_timeout = xhr_timeout
+        self.xhr_max_misses = xhr_max_misses
+        self._xhr_misses = 0
+        self.corpus = FixtureCorpus(capture_dir, secrets=[login, password]) if capture_dir else None
+        self.paginator = ShiftPaginator()
+        self._main_handle: str | None = None
+        self._watch_handles: dict[int, str] = dict()
 
     def create_driver(self):
-        chrome_options = get_chrome_options_for_environment()
+        chrome_options = get_chrome_options_for_environment(capture_network=self.capture_xhr)
 
         if is_running_in_docker():
             selenium_hub_url = "http://selenium-hub:4444/wd/hub"
             try:
                 self.driver = webdriver.Remote(
-                    command_executor=selenium_hub_url,
+                    command_executor=ChromeRemoteConnection(selenium_hub_url),
                     options=chrome_options
                 )
             except Exception as e:
@@ -181,6 +303,31 @@ class SeleniumClientInner:
             except Exception as e:
                 raise SeleniumLocalDriverException(f"Failed to create local Chrome driver: {str(e)}")
 
+        self._main_handle = self.driver.current_window_handle
+        self.install_request_blocking()
+
+    def install_request_blocking(self) -> None:
+        if not self.blocked_url_patterns and not self.capture_xhr:
+            return
+        try:
+            execute_cdp(self.driver, 'Network.enable')
+            if self.blocked_url_patterns:
+                execute_cdp(self.driver, 'Network.setBlockedURLs', {'urls': self.blocked_url_patterns})
+        except Exception as e:
+            logging.warning(f"Failed to install request blocking: {e}")
+
+    def _record_page_stats(self, kind: str, started_at: float) -> None:
+        stats = {'kind': kind, 'seconds': time.perf_counter() - started_at, 'bytes': 0, 'requests': 0}
+        try:
+            stats['bytes'], stats['requests'] = self.driver.execute_script(PAGE_STATS_SCRIPT)
+        except Exception:
+            pass
+        self._page_stats.append(stats)
+
+    def pop_page_stats(self) -> list[dict]:
+        page_stats, self._page_stats = self._page_stats, []
+        return page_stats
+
     def login(self):
         max_retries = 3
         for attempt in range(max_retries):
@@ -216,166 +363,687 @@ class SeleniumClientInner:
         except Exception as e:
             raise SeleniumElementNotFoundException("login button", f"Failed to find or click login button: {str(e)}")
 
-        time.sleep(5)
-
-        if self.driver.current_url != BASE_URL:
+        try:
+            WebDriverWait(self.driver, 30).until(expected_conditions.url_to_be(BASE_URL))
+        except TimeoutException:
             raise SeleniumLoginCredentialsException("Login failed - invalid credentials or login process failed")
 
-    def parse_shifts(self) -> list[ShiftBase]:
-        shift_set = set()
-        shift_cnt = 0
-        prev_shift: ShiftBase | None = None
-        for page in range(1, 10):
-            try:
-                self.driver.get(BASE_URL + f"?page={page}&ignoreRating=true&limit=200")
-                WebDriverWait(self.driver, 10).until(
-                    expected_conditions.presence_of_all_elements_located(
-                        (By.XPATH, "//*[@id=\"toolbar-portal-top\"]/aside/div/div/div[1]/div/div[1]/button")
-                    )
+        self.save_cookies()
+
+    def login_with_cookies(self, cookies: list[dict]) -> bool:
+        try:
+            self.driver.get(BASE_URL)
+            for cookie in cookies:
+                self.driver.add_cookie({key: value for key, value in cookie.items() if key != 'sameSite'})
+            self.driver.get(BASE_URL)
+            WebDriverWait(self.driver, 10).until(
+                expected_conditions.any_of(
+                    expected_conditions.presence_of_element_located((By.XPATH, TOOLBAR_XPATH)),
+                    expected_conditions.presence_of_element_located((By.ID, 'UserEmail'))
+                )
+            )
+        except Exception:
+            return False
+        return not self._is_login_page() and self.driver.current_url == BASE_URL
+
+    def export_cookies(self) -> list[dict]:
+        return self.driver.get_cookies()
+
+    def save_cookies(self) -> None:
+        if not self.cookies_path:
+            return
+        try:
+            temp_path = f"{self.cookies_path}.{os.getpid()}.tmp"
+            # Readable by the bot's user only, the cookies are as good as the account password
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.export_cookies(), f)
+            os.replace(temp_path, self.cookies_path)
+        except Exception as e:
+            logging.warning(f"Failed to persist Selenium cookies: {e}")
+
+    def load_cookies(self) -> list[dict] | None:
+        if not self.cookies_path or not os.path.exists(self.cookies_path):
+            return None
+        try:
+            with open(self.cookies_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logging.warning(f"Failed to read persisted Selenium cookies: {e}")
+            return None
+
+    def refresh_session(self) -> list[dict]:
+        self.driver.get(BASE_URL)
+        if self._is_login_page():
+            self.login()
+        return self.export_cookies()
+
+    def _is_login_page(self) -> bool:
+        return bool(self.driver.find_elements(By.ID, 'UserEmail'))
+
+    def _open_authenticated(self, url: str, locator: tuple[str, str], timeout: float = 10) -> None:
+        for attempt in range(2):
+            self.driver.get(url)
+            WebDriverWait(self.driver, timeout).until(
+                expected_conditions.any_of(
+                    expected_conditions.presence_of_element_located(locator),
+                    expected_conditions.presence_of_element_located((By.ID, 'UserEmail'))
                 )
+            )
+            if not self._is_login_page():
+                return
+            if attempt == 0:
+                logging.info("Selenium session expired, logging in again")
+                self.login()
+        raise SeleniumLoginException(f"Session expired and logging in again did not restore access to {url}")
+
+    def _drain_network_log(self) -> list[dict]:
+        events = []
+        for entry in get_browser_log(self.driver, 'performance'):
+            try:
+                events.append(json.loads(entry['message'])['message'])
+            except (KeyError, ValueError):
+                continue
+        return events
+
+    def _find_shifts_responses(self, events: list[dict]) -> list[str]:
+        request_ids = []
+        for event in events:
+            if event.get('method') != 'Network.responseReceived':
+                continue
+            response = event['params']['response']
+            if 'json' in response.get('mimeType', '') and self.xhr_url_pattern.search(response.get('url', '')):
+                request_ids.append(event['params']['requestId'])
+        return request_ids
+
+    def _read_response_body(self, request_id: str) -> Any:
+        body = execute_cdp(self.driver, 'Network.getResponseBody', {'requestId': request_id})
+        text = base64.b64decode(body['body']).decode('utf-8') if body.get('base64Encoded') else body['body']
+        return json.loads(text)
+
+    def _capture_shifts_payload(self) -> Any:
+        deadline = time.monotonic() + self.xhr_timeout
+        request_ids = []
+        while time.monotonic() < deadline:
+            request_ids += self._find_shifts_responses(self._drain_network_log())
+            for request_id in request_ids:
+                try:
+                    return self._read_response_body(request_id)
+                except Exception:
+                    # The body is not available until the response has finished loading
+                    continue
+            time.sleep(0.1)
+        return None
+
+    # Every miss costs the full xhr_timeout, so a pattern that never matches turns capture off for the session
+    def _record_xhr_miss(self) -> None:
+        self._xhr_misses += 1
+        if self._xhr_misses >= self.xhr_max_misses:
+            logging.warning(f"No shifts response matched {self.xhr_url_pattern.pattern} on {self._xhr_misses} pages "
+                            f"in a row, disabling XHR capture for this session")
+            self.capture_xhr = False
+
+    def parse_shifts_page(self, page: int) -> ShiftPage:
+        started_at = time.perf_counter()
+        if self.capture_xhr:
+            try:
+                self._drain_network_log()
             except Exception as e:
-                raise SeleniumPageLoadException(f"Failed to load shifts page {page}: {str(e)}")
+                logging.warning(f"Failed to read network log, disabling XHR capture: {e}")
+                self.capture_xhr = False
+        try:
+            self._open_authenticated(SHIFTS_PAGE_URL.format(page=page), (By.XPATH, TOOLBAR_XPATH))
+        except Exception as e:
+            raise SeleniumPageLoadException(f"Failed to load shifts page {page}: {str(e)}")
+        self._record_page_stats('list_page', started_at)
+        if self.corpus:
+            self._capture_list_page(page)
 
+        if self.capture_xhr:
             try:
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, "html.parser")
-                rows = soup.select("tbody tr")
+                payload = self._capture_shifts_payload()
+                if self.corpus and payload is not None:
+                    self._capture_xhr_payload(page, payload)
+                shifts, total = ShiftConverter.parse_shifts_payload(payload)
+                if shifts:
+                    self._xhr_misses = 0
+                    return ShiftPage(page=page, rows=[(shift, False) for shift in shifts], total=total)
+                logging.warning(f"No shifts captured from network log for page {page}, falling back to DOM")
             except Exception as e:
-                raise SeleniumShiftsParsingException(f"Failed to parse HTML for page {page}: {str(e)}")
-
-            for i, r in enumerate(rows):
-                liquidating = False
-                classes = r.get("class", None)
-                if classes and "MuiTableRow-root" in classes and "MuiTableRow-hover" in classes:
-                    text = [td.get_text(strip=True) for td in r.find_all(["td", "th"])]
-                    if text:
-                        if r.select("svg.jss42.jss44"):
-                            liquidating = True
-                        shift_schema = ShiftConverter.parse_shift_data(text)
-                        link = ShiftConverter.parse_shift_link(rows[i + 1].find("a").get("href"))
-                        if shift_schema and link:
-                            shift_schema.link = link
-                            if liquidating and prev_shift:
-                                prev_shift.connected_shifts.append(shift_schema)
-                            else:
-                                shift_set.add(shift_schema)
-                                prev_shift = shift_schema
-
-            if len(shift_set) == shift_cnt:
-                return list(shift_set)
-            else:
-                shift_cnt = len(shift_set)
+                logging.warning(f"XHR capture failed for page {page}, falling back to DOM: {e}")
+            self._record_xhr_miss()
+
+        if self.use_script_extraction:
+            try:
+                return ShiftConverter.parse_extracted_rows(self.driver.execute_script(EXTRACT_SHIFT_ROWS_SCRIPT), page)
+            except Exception as e:
+                logging.warning(f"Script extraction failed for page {page}, falling back to page source: {e}")
+
+        try:
+            return ShiftConverter.parse_shift_page(self.driver.page_source, page)
+        except Exception as e:
+            raise SeleniumShiftsParsingException(f"Failed to parse HTML for page {page}: {str(e)}")
+
+    def _capture_list_page(self, page: int) -> None:
+        try:
+            self.corpus.save_list_page(page, self.driver.page_source, self.driver.execute_script(EXTRACT_SHIFT_ROWS_SCRIPT))
+        except Exception as e:
+            logging.warning(f"Failed to capture shifts page {page}: {e}")
+
+    def _capture_xhr_payload(self, page: int, payload: Any) -> None:
+        try:
+            self.corpus.save_xhr_payload(page, json.dumps(payload, ensure_ascii=False))
+        except Exception as e:
+            logging.warning(f"Failed to capture shifts payload for page {page}: {e}")
+
+    def _switch_to_watch_tab(self, page: int) -> bool:
+        handle = self._watch_handles.get(page)
+        if handle is not None:
+            try:
+                self.driver.switch_to.window(handle)
+                return False
+            except NoSuchWindowException:
+                self._watch_handles.pop(page)
+        self.driver.switch_to.new_window('tab')
+        self._watch_handles[page] = self.driver.current_window_handle
+        return True
+
+    # Each watched page lives in its own tab with an observer flagging table changes, so a cycle
+    # only re-reads tabs whose rows actually changed. Returns None when the page is unchanged.
+    def watch_shifts_page(self, page: int, reload: bool = False) -> ShiftPage | None:
+        try:
+            reload = self._switch_to_watch_tab(page) or reload
+            extracted = None if reload else self.driver.execute_script(DRAIN_SHIFT_WATCH_SCRIPT)
+            if extracted == '':
+                return None
+            if extracted is None:
+                started_at = time.perf_counter()
+                self._open_authenticated(SHIFTS_PAGE_URL.format(page=page), (By.XPATH, TOOLBAR_XPATH))
+                self._record_page_stats('watch_page', started_at)
+                self.driver.execute_script(INSTALL_SHIFT_WATCH_SCRIPT)
+                extracted = self.driver.execute_script(EXTRACT_SHIFT_ROWS_SCRIPT)
+            return ShiftConverter.parse_extracted_rows(extracted, page)
+        except Exception as e:
+            raise SeleniumShiftsParsingException(f"Failed to watch shifts page {page}: {str(e)}")
+        finally:
+            self.driver.switch_to.window(self._main_handle)
+
+    def unwatch_shifts_page(self, page: int) -> None:
+        handle = self._watch_handles.pop(page, None)
+        if handle is None:
+            return
+        try:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        except NoSuchWindowException:
+            pass
+        finally:
+            self.driver.switch_to.window(self._main_handle)
 
-        return list(shift_set)
+    def parse_shifts(self) -> list[ShiftBase]:
+        self.paginator.begin()
+        while pages := self.paginator.next_pages():
+            self.paginator.add_pages([self.parse_shifts_page(page) for page in pages])
+        return self.paginator.finish()
 
     def parse_company_name(self, link: int) -> str | None:
+        started_at = time.perf_counter()
         try:
-            self.driver.get(BASE_URL + f"/{link}")
-            xpath = '//*[@id="react-mount-point"]/main/slot[2]/div/div[2]/div/div[1]/div/div/div/div[1]/ul[3]/li[2]/div/div[2]/div/span'
+            self._open_authenticated(BASE_URL + f"/{link}", (By.XPATH, COMPANY_NAME_XPATH))
             WebDriverWait(self.driver, 10).until(
-                expected_conditions.visibility_of_element_located((By.XPATH, xpath))
+                expected_conditions.visibility_of_element_located((By.XPATH, COMPANY_NAME_XPATH))
             )
-            el = self.driver.find_element(By.XPATH, xpath)
-            return el.text.strip()
+            el = self.driver.find_element(By.XPATH, COMPANY_NAME_XPATH)
+            self._record_page_stats('detail_page', started_at)
+            company_name = el.text.strip()
+            if self.corpus:
+                self.corpus.save_detail_page(link, self.driver.page_source, company_name)
+            return company_name
         except Exception as e:
-            # TODO log error
+            logging.warning(f"Failed to parse company name for shift {link}: {e}")
             return None
 
     def close_client(self) -> None:
         self.driver.quit()
 
 
+class SeleniumWorker:
+    def __init__(self, worker_id: int, process: multiprocessing.Process, command_queue: multiprocessing.Queue):
+        self.worker_id = worker_id
+        self.process = process
+        self.command_queue = command_queue
+        self.in_flight: set[str] = set()
+        # A worker runs one command at a time, so commands are handed over one by one and their
+        # deadline starts when the worker is free rather than when the caller asked
+        self.dispatch_lock = asyncio.Lock()
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def request_stop(self) -> None:
+        if self.process.is_alive():
+            self.command_queue.put(None)
+
+    def join(self, timeout: float = 10) -> None:
+        self.process.join(timeout=timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+
+
 class SeleniumClient:
-    def __init__(self, login: str, password: str):
+    def __init__(self,
+                 login: str,
+                 password: str,
+                 pool_size: int = 1,
+                 http_client: HttpShiftClient | None = None,
+                 warm_standby: bool = True,
+                 worker_options: dict | None = None,
+                 watch_mode: bool = False,
+                 watch_reload_interval: float = 60,
+                 watch_max_pages: int = 1):
         self.driver = None
         self.email = login
         self.password = password
         self.headless = False
-        self.process = None
-        self.command_queue = None
+        self.pool_size = max(1, pool_size)
+        self.warm_standby = warm_standby
+        self.worker_options = worker_options or {}
+        self.metrics = Metrics("selenium")
         self.result_queue = None
         self._is_ready = False
         self._task_counter = 0
+        self._start_timeout = 120
+        self._command_timeout = 60
+        self._reader_poll_interval = 1
+        self._reader_task: asyncio.Task | None = None
+        self._workers: list[SeleniumWorker] = []
+        self._worker_counter = 0
+        self._pending: dict[str, asyncio.Future] = {}
+        self._http_client = http_client
+        self._http_failures = 0
+        self._max_http_failures = 3
+        self._paginator = ShiftPaginator()
+        self._page_deltas = PageDeltaDecoder()
+        self.watch_mode = watch_mode and http_client is None
+        self.watch_reload_interval = watch_reload_interval
+        self.watch_max_pages = max(1, watch_max_pages)
+        self._watch_pages: dict[int, ShiftPage] = dict()
+        self._watch_shifts: list[ShiftBase] = []
+        self._watch_reloaded_at: float | None = None
 
     async def start_process(self) -> None:
-        if self.process and self.process.is_alive():
+        if self._workers and all(worker.is_alive() for worker in self._workers):
             return
-        self.command_queue = multiprocessing.Queue()
+        await self.close_driver()
+
         self.result_queue = multiprocessing.Queue()
+        self._reader_task = asyncio.create_task(self._read_results(self.result_queue))
+
+        try:
+            primary, cookies = await self._start_worker()
+        except (SeleniumCommandException, SeleniumCommandTimeoutException):
+            await self.close_driver()
+            raise
+        self._workers.append(primary)
+        self._set_http_cookies(cookies)
+
+        results = await asyncio.gather(
+            *(self._start_worker(cookies) for _ in range(1, self.pool_size)),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logging.warning(f"Selenium worker failed to start, continuing with a smaller pool: {result}")
+            else:
+                self._workers.append(result[0])
 
-        self.process = multiprocessing.Process(
+        logging.info(f"Selenium pool is ready with {len(self._workers)}/{self.pool_size} workers")
+        self._is_ready = True
+
+    @property
+    def is_ready(self) -> bool:
+        return self._is_ready and any(worker.is_alive() for worker in self._workers)
+
+    async def restart(self) -> None:
+        await self.close_driver()
+        await self.start_process()
+
+    # Swaps in freshly logged in workers while the pool keeps serving. Returns False without touching
+    # the pool when that is not possible, the caller then restarts it in place with restart()
+    async def recycle(self) -> bool:
+        if not self._is_ready or not self.warm_standby:
+            return False
+
+        try:
+            standby, cookies = await self._start_worker()
+        except (SeleniumCommandException, SeleniumCommandTimeoutException) as e:
+            logging.warning(f"Standby Selenium worker failed to start, the pool has to restart in place: {e}")
+            return False
+        self._set_http_cookies(cookies)
+
+        old_workers = list(self._workers)
+        if not old_workers:
+            self._workers.append(standby)
+        else:
+            await self._swap_worker(old_workers[0], standby)
+
+        for old_worker in old_workers[1:]:
+            try:
+                standby, _ = await self._start_worker(cookies)
+            except (SeleniumCommandException, SeleniumCommandTimeoutException) as e:
+                logging.warning(f"Standby Selenium worker failed to start, keeping worker {old_worker.worker_id}: {e}")
+                continue
+            await self._swap_worker(old_worker, standby)
+
+        logging.info(f"Selenium pool recycled with {len(self._workers)}/{self.pool_size} workers")
+        return True
+
+    async def _swap_worker(self, old_worker: SeleniumWorker, new_worker: SeleniumWorker) -> None:
+        if old_worker in self._workers:
+            self._workers[self._workers.index(old_worker)] = new_worker
+        else:
+            self._workers.append(new_worker)
+        self._is_ready = True
+        # The shutdown sentinel queues up behind the commands already sent to the old worker,
+        # so it finishes them before exiting and their results still arrive on the shared queue
+        old_worker.request_stop()
+        await asyncio.to_thread(old_worker.join, self._command_timeout)
+
+    def _set_http_cookies(self, cookies: list[dict]) -> None:
+        if self._http_client:
+            self._http_client.set_cookies(cookies)
+
+    async def _start_worker(self, cookies: list[dict] | None = None) -> tuple[SeleniumWorker, list[dict]]:
+        self._worker_counter += 1
+        worker_id = self._worker_counter
+        command_queue = multiprocessing.Queue()
+        process = multiprocessing.Process(
             target=selenium_process_runner,
-            args=(self.email, self.password, self.command_queue, self.result_queue)
+            args=(self.email, self.password, command_queue, self.result_queue, worker_id, cookies, self.worker_options)
         )
+        process.start()
+        worker = SeleniumWorker(worker_id, process, command_queue)
 
-        self.process.start()
+        ready_id = f"{READY_TASK_ID}_{worker_id}"
+        ready = asyncio.get_running_loop().create_future()
+        self._pending[ready_id] = ready
 
-        timeout_counter = 0
-        max_timeout = 600
+        try:
+            cookies = await asyncio.wait_for(ready, timeout=self._start_timeout)
+        except asyncio.TimeoutError:
+            worker.request_stop()
+            await asyncio.to_thread(worker.join)
+            raise SeleniumCommandTimeoutException("start_process", self._start_timeout)
+        except SeleniumCommandException:
+            await asyncio.to_thread(worker.join)
+            raise
+        finally:
+            self._pending.pop(ready_id, None)
 
-        while timeout_counter < max_timeout:
-            if not self.result_queue.empty():
-                result = self.result_queue.get()
-                if result['type'] == 'ready':
-                    self._is_ready = True
-                    break
-                else:
-                    raise SeleniumCommandException("start_process", f"Selenium task failed: {result['data']}")
-            await asyncio.sleep(0.2)
-            timeout_counter += 1
-            
-        if timeout_counter >= max_timeout:
-            if self.process and self.process.is_alive():
-                self.process.terminate()
-            raise SeleniumCommandTimeoutException("start_process", max_timeout * 0.2)
-
-    async def _send_command(self, command_type: str, **kwargs) -> Any:
+        return worker, cookies
+
+    async def _read_results(self, result_queue: multiprocessing.Queue) -> None:
+        while True:
+            try:
+                result = await asyncio.to_thread(result_queue.get, True, self._reader_poll_interval)
+            except queue.Empty:
+                self._reap_dead_workers()
+                continue
+            except (EOFError, OSError, ValueError):
+                return
+
+            if result is None:
+                return
+            self._dispatch_result(result)
+
+    def _dispatch_result(self, result: dict) -> None:
+        result_type = result.get('type')
+
+        if result_type == 'ready':
+            future = self._pending.pop(f"{READY_TASK_ID}_{result['worker_id']}", None)
+            if future and not future.done():
+                future.set_result(result['data'])
+            return
+
+        if result_type == 'fatal_error':
+            worker_id = result.get('worker_id')
+            logging.error(f"Selenium worker {worker_id} fatal error: {result['data']}")
+            exception = SeleniumCommandException("start_process", f"Selenium task failed: {result['data']}")
+            future = self._pending.pop(f"{READY_TASK_ID}_{worker_id}", None)
+            if future and not future.done():
+                future.set_exception(exception)
+            for worker in [worker for worker in self._workers if worker.worker_id == worker_id]:
+                self._remove_worker(worker, exception)
+            return
+
+        task_id = result.get('task_id')
+        timing = result.get('timing')
+        if timing:
+            logging.debug(f"Selenium {task_id}: queued {timing['queued'] * 1000:.1f} ms, "
+                          f"executed {timing.get('elapsed', 0) * 1000:.1f} ms")
+        for page_stats in result.get('page_stats') or []:
+            self.metrics.observe(page_stats['kind'], page_stats['seconds'])
+            self.metrics.increment(f"{page_stats['kind']}_bytes", page_stats['bytes'])
+            self.metrics.increment(f"{page_stats['kind']}_requests", page_stats['requests'])
+        future = self._pending.pop(task_id, None) if task_id else None
+        if future is None:
+            logging.warning(f"Dropping Selenium result without waiting command: {result_type} {task_id}")
+            return
+        if future.done():
+            return
+
+        if result_type == 'success':
+            future.set_result(result['data'])
+        else:
+            future.set_exception(
+                SeleniumCommandException(result.get('command_type'), f"Selenium task failed: {result['data']}")
+            )
+
+    def _reap_dead_workers(self) -> None:
+        for worker in [worker for worker in self._workers if not worker.is_alive()]:
+            logging.error(f"Selenium worker {worker.worker_id} exited unexpectedly")
+            self._remove_worker(worker, SeleniumCommandException(None, "Selenium process exited unexpectedly"))
+
+    def _remove_worker(self, worker: SeleniumWorker, exception: Exception) -> None:
+        self._workers.remove(worker)
+        for task_id in worker.in_flight:
+            future = self._pending.pop(task_id, None)
+            if future and not future.done():
+                future.set_exception(exception)
+        if not self._workers:
+            self._is_ready = False
+
+    def _fail_pending(self, exception: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exception)
+
+    def _select_worker(self, pin: int | None = None) -> SeleniumWorker:
+        if not self._workers:
+            raise SeleniumWebDriverNotReadyException("No Selenium workers are available")
+        if pin is not None:
+            return self._workers[pin % len(self._workers)]
+        return min(self._workers, key=lambda worker: len(worker.in_flight))
+
+    async def _send_command(self, command_type: str, pin: int | None = None, **kwargs) -> Any:
         if not self._is_ready:
             raise SeleniumWebDriverNotReadyException("WebDriver is not ready for commands")
-        
+
+        worker = self._select_worker(pin)
         self._task_counter += 1
         task_id = f"task_{self._task_counter}"
-        
-        command = {
-            'type': command_type,
-            'task_id': task_id,
-            **kwargs
-        }
-
-        self.command_queue.put(command)
-
-        timeout_counter = 0
-        max_timeout = 300
-
-        while timeout_counter < max_timeout:
-            if not self.result_queue.empty():
-                result = self.result_queue.get()
-                if result.get('task_id') == task_id:
-                    if result['type'] == 'success':
-                        return result['data']
-                    else:
-                        raise SeleniumCommandException(command_type, f"Selenium task failed: {result['data']}")
-            await asyncio.sleep(0.2)
-            timeout_counter += 1
-
-        raise SeleniumCommandTimeoutException(command_type, max_timeout * 0.2)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[task_id] = future
+        worker.in_flight.add(task_id)
+        try:
+            async with worker.dispatch_lock:
+                if future.done():
+                    return future.result()
+                sent_at = time.time()
+                worker.command_queue.put({
+                    'type': command_type,
+                    'task_id': task_id,
+                    'sent_at': sent_at,
+                    'deadline': sent_at + self._command_timeout,
+                    **kwargs
+                })
+                try:
+                    return await asyncio.wait_for(future, timeout=self._command_timeout)
+                except asyncio.TimeoutError:
+                    raise SeleniumCommandTimeoutException(command_type, self._command_timeout)
+        finally:
+            self._pending.pop(task_id, None)
+            worker.in_flight.discard(task_id)
 
     async def parse_shifts(self) -> list[ShiftBase]:
-        return await self._send_command('parse_shifts')
+        if self._http_client:
+            return await self._parse_shifts_http()
+        return await self._parse_shifts_selenium()
+
+    async def _parse_shifts_http(self) -> list[ShiftBase]:
+        if not self._is_ready:
+            raise SeleniumWebDriverNotReadyException("WebDriver is not ready for commands")
+        try:
+            shifts = await self._fetch_shifts_http()
+        # A session that is still expired after refreshing it through Chrome counts as a failed fetch
+        except (HttpFetchException, HttpSessionExpiredException) as e:
+            return await self._fall_back_to_selenium(e)
+        self._http_failures = 0
+        # Pages parsed through Chrome before are no baseline for this snapshot any more
+        self._page_deltas.reset()
+        return shifts
+
+    async def _fetch_shifts_http(self) -> list[ShiftBase]:
+        if not self._http_client.has_session:
+            self._http_client.set_cookies(await self._send_command('export_cookies'))
+        try:
+            return await self._http_client.parse_shifts()
+        except HttpSessionExpiredException:
+            logging.info("HTTP session expired, refreshing it through Chrome")
+            self._http_client.set_cookies(await self._send_command('refresh_session'))
+            return await self._http_client.parse_shifts()
+
+    async def _fall_back_to_selenium(self, exception: HttpBaseException) -> list[ShiftBase]:
+        self._http_failures += 1
+        self.metrics.increment("http_fallbacks")
+        logging.warning(f"HTTP fetch failed, parsing shifts through Chrome instead: {exception}")
+        if self._http_failures >= self._max_http_failures:
+            logging.warning(f"HTTP fetch failed {self._http_failures} times in a row, "
+                            f"using Chrome for the rest of the session")
+            await self._http_client.close()
+            self._http_client = None
+        return await self._parse_shifts_selenium()
+
+    async def _parse_shifts_selenium(self) -> list[ShiftBase]:
+        shifts = await self._paginator.run(self._parse_shifts_page, concurrency=len(self._workers))
+        # Pages past the end of a full scan are gone from the board, their rows count as removed
+        if not self._paginator.stopped_early:
+            for page in self._page_deltas.pages:
+                if page >= self._paginator.next_page:
+                    self._page_deltas.forget(page)
+        return shifts
+
+    # Links whose rows changed since acknowledge_changes(), None when everything has to be compared
+    @property
+    def changed_links(self) -> set[int] | None:
+        return None if self._page_deltas.changed_links is None else set(self._page_deltas.changed_links)
+
+    def acknowledge_changes(self) -> None:
+        self._page_deltas.acknowledge()
+
+    # Pages are pinned to workers so each worker can answer with a delta against the snapshot it sent last
+    async def _parse_shifts_page(self, page: int) -> ShiftPage:
+        delta = await self._send_command('parse_shifts_page', pin=page - 1, page=page,
+                                         since=self._page_deltas.since(page))
+        return self._apply_page_delta(delta)
+
+    def _apply_page_delta(self, delta: ShiftPageDelta) -> ShiftPage:
+        if delta.base_version is None:
+            self.metrics.increment("delta_full_pages")
+        self.metrics.increment("delta_upserts", len(delta.upserts))
+        try:
+            return self._page_deltas.apply(delta)
+        except ValueError:
+            self._page_deltas.forget(delta.page)
+            raise
+
+    async def watch_shifts(self) -> list[ShiftBase]:
+        if not self._is_ready:
+            raise SeleniumWebDriverNotReadyException("WebDriver is not ready for commands")
+        reload = (self._watch_reloaded_at is None
+                  or time.monotonic() - self._watch_reloaded_at > self.watch_reload_interval)
+        page_count = max(self._watch_pages, default=1)
+        pages = list(range(1, page_count + 1))
+        changed = False
+        while pages:
+            deltas = await asyncio.gather(*(self._watch_shifts_page(page, reload) for page in pages))
+            for page, delta in zip(pages, deltas):
+                if delta is not None and delta.version != delta.base_version:
+                    self._watch_pages[page] = self._apply_page_delta(delta)
+                    changed = True
+            pages = list(range(page_count + 1, self._watch_page_count() + 1))
+            page_count = max(page_count, self._watch_page_count())
+
+        for page in [page for page in self._watch_pages if page > self._watch_page_count()]:
+            del self._watch_pages[page]
+            self._page_deltas.forget(page)
+            changed = True
+            if page <= self.watch_max_pages:
+                await self._send_command('unwatch_shifts_page', pin=page - 1, page=page)
+        if reload:
+            self._watch_reloaded_at = time.monotonic()
+            self.metrics.increment("watch_reloads")
+
+        if changed:
+            collector = ShiftCollector()
+            for page in sorted(self._watch_pages):
+                collector.add_page(self._watch_pages[page].rows)
+            self._watch_shifts = collector.shifts
+            self.metrics.increment("watch_changes")
+        self.metrics.increment("watch_cycles")
+        return self._watch_shifts
+
+    # Only the first pages get a tab each, polling a tab per page keeps a renderer busy for every page.
+    # The rest are read on reload cycles, so their changes show up within the reload interval.
+    async def _watch_shifts_page(self, page: int, reload: bool) -> ShiftPageDelta | None:
+        if page <= self.watch_max_pages:
+            return await self._send_command('watch_shifts_page', pin=page - 1, page=page, reload=reload,
+                                            since=self._page_deltas.since(page))
+        if not reload and page in self._watch_pages:
+            return None
+        return await self._send_command('parse_shifts_page', pin=page - 1, page=page,
+                                        since=self._page_deltas.since(page))
+
+    def _watch_page_count(self) -> int:
+        first_page = self._watch_pages.get(1)
+        if first_page is None or not first_page.rows:
+            return 1
+        if first_page.total is None:
+            return MAX_SHIFT_PAGES
+        return min(MAX_SHIFT_PAGES, max(1, math.ceil(first_page.total / SHIFTS_PAGE_LIMIT)))
 
     async def parse_company_name(self, link: int) -> str | None:
         return await self._send_command('parse_company_name', link=link)
 
-    def close_driver(self) -> None:
-        if self.process and self.process.is_alive():
-            self.command_queue.put({'type': 'shutdown'})
-            self.process.join(timeout=10)
-            if self.process.is_alive():
-                self.process.terminate()
-                self.process.join()
-        
+    async def close(self) -> None:
+        await self.close_driver()
+        if self._http_client:
+            await self._http_client.close()
+
+    async def close_driver(self) -> None:
+        self._is_ready = False
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.request_stop()
+        await asyncio.gather(*(asyncio.to_thread(worker.join) for worker in workers))
+
+        if self.result_queue:
+            self.result_queue.put(None)
+        self._fail_pending(SeleniumWebDriverNotReadyException("WebDriver was closed"))
+
         self._task_counter = 0
-        self.process = None
-        self.command_queue = None
         self.result_queue = None
-        self._is_ready = False
+        self._reader_task = None
@@ -1,2 +1,104 @@
-BASE_URL = "https://shameless.sinch.cz/react/position"
+import os
+
+BASE_URL = os.getenv("SHIFT_BOARD_BASE_URL", "https://shameless.sinch.cz/react/position")
 HEADLESS = True
+SHIFTS_PAGE_LIMIT = 200
+MAX_SHIFT_PAGES = 9
+SHIFTS_PAGE_QUERY = "?page={page}&ignoreRating=true&limit=" + str(SHIFTS_PAGE_LIMIT)
+SHIFTS_PAGE_URL = BASE_URL + SHIFTS_PAGE_QUERY
+TOOLBAR_XPATH = "//*[@id=\"toolbar-portal-top\"]/aside/div/div/div[1]/div/div[1]/button"
+LOGIN_FORM_MARKER = 'id="UserEmail"'
+COMPANY_NAME_XPATH = ('//*[@id="react-mount-point"]/main/slot[2]/div/div[2]/div/div[1]/div/div/div/div[1]'
+                      '/ul[3]/li[2]/div/div[2]/div/span')
+COMPANY_NAME_SELECTOR = ("#react-mount-point > main > slot:nth-of-type(2) > div > div:nth-of-type(2) > div"
+                         " > div:nth-of-type(1) > div > div > div > div:nth-of-type(1) > ul:nth-of-type(3)"
+                         " > li:nth-of-type(2) > div > div:nth-of-type(2) > div > span")
+PAGINATION_CAPTION_SELECTOR = ".MuiTablePagination-caption, .MuiTablePagination-displayedRows"
+EXTRACT_SHIFT_ROWS_SCRIPT = """
+const PAGINATION_CAPTION_SELECTOR = '""" + PAGINATION_CAPTION_SELECTOR + """';
+const text = (node) => {
+    const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+    let value = '';
+    while (walker.nextNode()) {
+        value += walker.currentNode.nodeValue.trim();
+    }
+    return value;
+};
+const rows = document.querySelectorAll('tbody tr');
+const result = [];
+for (let i = 0; i < rows.length - 1; i++) {
+    const row = rows[i];
+    if (!row.classList.contains('MuiTableRow-root') || !row.classList.contains('MuiTableRow-hover')) {
+        continue;
+    }
+    const cells = Array.from(row.querySelectorAll('td, th'), text);
+    if (!cells.length) {
+        continue;
+    }
+    const anchor = rows[i + 1].querySelector('a');
+    result.push([cells, row.querySelector('svg.jss42.jss44') !== null, anchor ? anchor.getAttribute('href') : null]);
+}
+const captions = Array.from(document.querySelectorAll(PAGINATION_CAPTION_SELECTOR), caption => caption.textContent);
+return JSON.stringify({rows: result, total: captions.join('\\n')});
+"""
+INSTALL_SHIFT_WATCH_SCRIPT = """
+const PAGINATION_CAPTION_SELECTOR = '""" + PAGINATION_CAPTION_SELECTOR + """';
+if (window.__shiftWatch) {
+    window.__shiftWatch.observer.disconnect();
+}
+const watch = {dirty: false, changes: 0};
+const relevant = (mutation) => {
+    const node = mutation.target.nodeType === Node.ELEMENT_NODE ? mutation.target : mutation.target.parentElement;
+    return node !== null && node.closest('table, ' + PAGINATION_CAPTION_SELECTOR) !== null;
+};
+watch.observer = new MutationObserver((mutations) => {
+    if (mutations.some(relevant)) {
+        watch.dirty = true;
+        watch.changes++;
+    }
+});
+watch.observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+window.__shiftWatch = watch;
+"""
+DRAIN_SHIFT_WATCH_SCRIPT = """
+if (!window.__shiftWatch) {
+    return null;
+}
+if (!window.__shiftWatch.dirty) {
+    return '';
+}
+window.__shiftWatch.dirty = false;
+""" + EXTRACT_SHIFT_ROWS_SCRIPT
+DEFAULT_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico", "*.bmp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3",
+    "*.map",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*hotjar.com*", "*facebook.net*", "*connect.facebook.com*", "*sentry.io*",
+    "*intercom.io*", "*intercomcdn.com*", "*smartlook*", "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+]
+PAGE_STATS_SCRIPT = """
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return [entries.reduce((sum, entry) => sum + (entry.transferSize || 0), 0), entries.length];
+"""
+# The board shows Prague wall-clock times, timestamps from the API are converted to match
+BOARD_TIMEZONE = "Europe/Prague"
+# The board API has not been recorded yet, so the URL pattern, keys and aliases below are unverified
+# guesses. XHR capture stays off (SELENIUM_CAPTURE_XHR) until a corpus recorded with it on passes
+# python -m benchmarks.scraper_benchmark --corpus <dir> --check-xhr
+XHR_SHIFTS_URL_PATTERN = r"/api/.*position"
+XHR_LIST_KEYS = ["data", "items", "results", "rows", "positions", "content"]
+XHR_TOTAL_KEYS = ["total", "totalCount", "count", "totalItems"]
+XHR_CONNECTED_KEYS = ["connectedPositions", "connected", "children", "linked"]
+XHR_FIELD_ALIASES = {
+    "link": ["id", "positionId"],
+    "name": ["name", "title", "positionName", "eventName"],
+    "start": ["start", "startAt", "startTime", "dateFrom", "from"],
+    "end": ["end", "endAt", "endTime", "dateTo", "to"],
+    "location": ["location", "place", "venue", "locationName"],
+    "company": ["company", "client", "customer", "companyName"],
+    "position": ["position", "role", "profession", "positionType"],
+    "occupied": ["occupied", "filled", "assigned", "workersCount", "occupancy"],
+    "max_occupy": ["capacity", "maxOccupy", "maxWorkers", "required", "size"],
+}
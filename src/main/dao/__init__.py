@@ -2,10 +2,14 @@ from .base_dao import BaseDAO
 from .user_dao import UserDAO
 from .filter_dao import FilterDAO
 from .mute_dao import MuteDAO
+from .shift_company_dao import ShiftCompanyDAO
+from .outbox_dao import OutboxDAO
 
 __all__ = [
     "BaseDAO",
     "UserDAO", 
     "FilterDAO",
-    "MuteDAO"
+    "MuteDAO",
+    "ShiftCompanyDAO",
+    "OutboxDAO"
 ]
@@ -11,9 +11,21 @@ from ..schemas.filter import ListFieldBase
 
 
 class FilterDAO(BaseDAO[Filter, FilterBase]):
+    # Edit counters per filter id, kept for the process lifetime so callers can cache what they derive
+    # from a filter. They are bumped after the change is committed.
+    _versions: dict[int, int] = dict()
+
     def __init__(self, db_helper: DatabaseHelper):
         super().__init__(db_helper, Filter, FilterBase)
 
+    @classmethod
+    def version(cls, filter_id: int) -> int:
+        return cls._versions.get(filter_id, 0)
+
+    @classmethod
+    def _touch(cls, filter_id: int) -> None:
+        cls._versions[filter_id] = cls.version(filter_id) + 1
+
     def _convert_to_schema(self, filter_obj: Filter) -> FilterBase:
         companies = []
         try:
@@ -68,6 +80,15 @@ class FilterDAO(BaseDAO[Filter, FilterBase]):
         print(filter_obj)
         return filter_obj
 
+    async def update(self, obj_id: int, **kwargs) -> FilterBase | None:
+        filter_obj = await super().update(obj_id, **kwargs)
+        FilterDAO._touch(obj_id)
+        return filter_obj
+
+    async def delete(self, obj_id: int) -> None:
+        await super().delete(obj_id)
+        FilterDAO._touch(obj_id)
+
     async def clear_longer(self, filter_id: int) -> None:
         await self.update(filter_id, longer=None)
 
@@ -83,6 +104,7 @@ class FilterDAO(BaseDAO[Filter, FilterBase]):
             session.add(company_obj)
             await session.commit()
             await session.refresh(company_obj)
+        FilterDAO._touch(filter_id)
 
     async def add_location(self, filter_id: int, location_data: str) -> None:
         async for session in self.db_helper.session_dependency():
@@ -93,6 +115,7 @@ class FilterDAO(BaseDAO[Filter, FilterBase]):
             session.add(location_obj)
             await session.commit()
             await session.refresh(location_obj)
+        FilterDAO._touch(filter_id)
 
     async def add_position(self, filter_id: int, position_data: str) -> None:
         async for session in self.db_helper.session_dependency():
@@ -103,6 +126,7 @@ class FilterDAO(BaseDAO[Filter, FilterBase]):
             session.add(position_obj)
             await session.commit()
             await session.refresh(position_obj)
+        FilterDAO._touch(filter_id)
 
     async def remove_company(self, filter_id: int, company_id: int):
         async for session in self.db_helper.session_dependency():
@@ -117,6 +141,7 @@ class FilterDAO(BaseDAO[Filter, FilterBase]):
             if company_obj:
                 await session.delete(company_obj)
                 await session.commit()
+        FilterDAO._touch(filter_id)
 
     async def remove_location(self, filter_id: int, location_id: int):
         async for session in self.db_helper.session_dependency():
@@ -131,6 +156,7 @@ class FilterDAO(BaseDAO[Filter, FilterBase]):
             if location_obj:
                 await session.delete(location_obj)
                 await session.commit()
+        FilterDAO._touch(filter_id)
 
     async def remove_position(self, filter_id: int, position_id: int):
         async for session in self.db_helper.session_dependency():
@@ -145,8 +171,11 @@ class FilterDAO(BaseDAO[Filter, FilterBase]):
             if position_obj:
                 await session.delete(position_obj)
                 await session.commit()
+        FilterDAO._touch(filter_id)
 
     async def get_batch_user_filters(self, user_ids: list[int]) -> dict[int, list[FilterBase]]:
+        # Versions are read before the filters, so an edit committed in between can only make them look older
+        versions = dict(FilterDAO._versions)
         async for session in self.db_helper.session_dependency():
             stmt = select(Filter).options(
                 selectinload(Filter.companies),
@@ -161,6 +190,8 @@ class FilterDAO(BaseDAO[Filter, FilterBase]):
                 user_id = filter_obj.user_id
                 if user_id not in grouped_filters:
                     grouped_filters[user_id] = []
-                grouped_filters[user_id].append(self._convert_to_schema(filter_obj))
+                filter_data = self._convert_to_schema(filter_obj)
+                filter_data.version = versions.get(filter_obj.id, 0)
+                grouped_filters[user_id].append(filter_data)
 
             return grouped_filters
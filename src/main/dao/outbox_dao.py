@@ -0,0 +1,155 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update, delete, insert, func
+
+from .base_dao import BaseDAO
+from src.main.domain import OutboxMessage
+from src.main.schemas import OutboxMessageBase, OutboxStatus
+from src.main.utils.db_helper import DatabaseHelper
+
+
+class OutboxDAO(BaseDAO[OutboxMessage, OutboxMessageBase]):
+    def __init__(self, db_helper: DatabaseHelper):
+        super().__init__(db_helper, OutboxMessage, OutboxMessageBase)
+
+    def _convert_to_schema(self, outbox_obj: OutboxMessage) -> OutboxMessageBase:
+        return OutboxMessageBase(
+            id=outbox_obj.id,
+            user_id=outbox_obj.user_id,
+            chat_id=outbox_obj.chat_id,
+            shift_link=outbox_obj.shift_link,
+            text=outbox_obj.text,
+            keyboard=outbox_obj.keyboard,
+            protect_content=outbox_obj.protect_content,
+            status=OutboxStatus(outbox_obj.status),
+            attempts=outbox_obj.attempts,
+            last_error=outbox_obj.last_error,
+            available_at=outbox_obj.available_at,
+            created_at=outbox_obj.created_at
+        )
+
+    async def save_batch(self, messages: list[OutboxMessageBase]) -> None:
+        if not messages:
+            return
+        now = datetime.utcnow()
+        async for session in self.db_helper.session_dependency():
+            await session.execute(insert(OutboxMessage), [
+                {
+                    'user_id': message.user_id,
+                    'chat_id': message.chat_id,
+                    'shift_link': message.shift_link,
+                    'text': message.text,
+                    'keyboard': message.keyboard,
+                    'protect_content': message.protect_content,
+                    'status': OutboxStatus.PENDING.value,
+                    'attempts': 0,
+                    'available_at': now,
+                    'created_at': now
+                }
+                for message in messages
+            ])
+            await session.commit()
+
+    # Claimed rows are leased: a worker that dies mid-delivery leaves them in "sending" and they are
+    # claimed again once the lease runs out. SKIP LOCKED lets concurrent workers take disjoint batches.
+    # Every claim counts as an attempt, so a row that keeps taking its worker down is failed once it
+    # has used up max_attempts instead of being claimed forever.
+    async def claim_batch(self, limit: int, lease: timedelta, max_attempts: int) -> list[OutboxMessageBase]:
+        now = datetime.utcnow()
+        claimable = [
+            OutboxMessage.status.in_([OutboxStatus.PENDING.value, OutboxStatus.SENDING.value]),
+            OutboxMessage.available_at <= now
+        ]
+        async for session in self.db_helper.session_dependency():
+            exhausted = select(OutboxMessage.id).where(
+                *claimable,
+                OutboxMessage.attempts >= max_attempts
+            ).with_for_update(skip_locked=True)
+            await session.execute(
+                update(OutboxMessage).where(OutboxMessage.id.in_(exhausted.scalar_subquery())).values(
+                    status=OutboxStatus.FAILED.value,
+                    last_error=f"Not delivered after {max_attempts} attempts"
+                )
+            )
+            due = select(OutboxMessage.id).where(
+                *claimable,
+                OutboxMessage.attempts < max_attempts
+            ).order_by(OutboxMessage.available_at, OutboxMessage.id).limit(limit).with_for_update(skip_locked=True)
+            stmt = update(OutboxMessage).where(OutboxMessage.id.in_(due.scalar_subquery())).values(
+                status=OutboxStatus.SENDING.value,
+                attempts=OutboxMessage.attempts + 1,
+                available_at=now + lease
+            ).returning(OutboxMessage)
+            result = await session.execute(stmt)
+            messages = [self._convert_to_schema(outbox_obj) for outbox_obj in result.scalars().all()]
+            await session.commit()
+            return messages
+
+    async def mark_sent(self, message_ids: list[int]) -> None:
+        if not message_ids:
+            return
+        async for session in self.db_helper.session_dependency():
+            await session.execute(
+                update(OutboxMessage).where(OutboxMessage.id.in_(message_ids)).values(
+                    status=OutboxStatus.SENT.value,
+                    last_error=None
+                )
+            )
+            await session.commit()
+
+    async def mark_retry(self, message_id: int, delay: timedelta, error: str | None, count_attempt: bool = True) -> None:
+        async for session in self.db_helper.session_dependency():
+            values = {
+                'status': OutboxStatus.PENDING.value,
+                'available_at': datetime.utcnow() + delay,
+                'last_error': error
+            }
+            if not count_attempt:
+                values['attempts'] = OutboxMessage.attempts - 1
+            await session.execute(update(OutboxMessage).where(OutboxMessage.id == message_id).values(**values))
+            await session.commit()
+
+    # Hands claimed rows back without spending the claim's attempt, for a worker that stops before delivering them
+    async def release(self, message_ids: list[int]) -> None:
+        if not message_ids:
+            return
+        async for session in self.db_helper.session_dependency():
+            await session.execute(
+                update(OutboxMessage).where(
+                    OutboxMessage.id.in_(message_ids),
+                    OutboxMessage.status == OutboxStatus.SENDING.value
+                ).values(
+                    status=OutboxStatus.PENDING.value,
+                    attempts=OutboxMessage.attempts - 1,
+                    available_at=datetime.utcnow()
+                )
+            )
+            await session.commit()
+
+    async def mark_failed(self, message_id: int, error: str | None) -> None:
+        async for session in self.db_helper.session_dependency():
+            await session.execute(
+                update(OutboxMessage).where(OutboxMessage.id == message_id).values(
+                    status=OutboxStatus.FAILED.value,
+                    last_error=error
+                )
+            )
+            await session.commit()
+
+    async def count_by_status(self) -> dict[OutboxStatus, int]:
+        async for session in self.db_helper.session_dependency():
+            result = await session.execute(
+                select(OutboxMessage.status, func.count()).group_by(OutboxMessage.status)
+            )
+            return {OutboxStatus(status): count for status, count in result.all()}
+
+    async def cleanup_delivered(self, older_than: timedelta) -> None:
+        cutoff_time = datetime.utcnow() - older_than
+        async for session in self.db_helper.session_dependency():
+            await session.execute(
+                delete(OutboxMessage).where(
+                    OutboxMessage.status.in_([OutboxStatus.SENT.value, OutboxStatus.FAILED.value]),
+                    OutboxMessage.created_at < cutoff_time
+                )
+            )
+            await session.commit()
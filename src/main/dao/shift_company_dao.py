@@ -0,0 +1,71 @@
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from .base_dao import BaseDAO
+from src.main.domain import ShiftCompany
+from src.main.schemas import ShiftCompanyBase
+from src.main.utils.db_helper import DatabaseHelper
+
+
+class ShiftCompanyDAO(BaseDAO[ShiftCompany, ShiftCompanyBase]):
+    def __init__(self, db_helper: DatabaseHelper):
+        super().__init__(db_helper, ShiftCompany, ShiftCompanyBase)
+
+    def _convert_to_schema(self, shift_company_obj: ShiftCompany) -> ShiftCompanyBase:
+        return ShiftCompanyBase(
+            id=shift_company_obj.id,
+            shift_link=shift_company_obj.shift_link,
+            name=shift_company_obj.name,
+            location=shift_company_obj.location,
+            position=shift_company_obj.position,
+            company=shift_company_obj.company,
+            created_at=shift_company_obj.created_at
+        )
+
+    async def get_batch_by_links(self, shift_links: list[int]) -> dict[int, str]:
+        async for session in self.db_helper.session_dependency():
+            stmt = select(ShiftCompany.shift_link, ShiftCompany.company).where(
+                ShiftCompany.shift_link.in_(shift_links)
+            )
+            result = await session.execute(stmt)
+            return {shift_link: company for shift_link, company in result.all()}
+
+    async def get_batch_by_series(self, series: list[tuple[str, str, str]]) -> dict[tuple[str, str, str], str]:
+        async for session in self.db_helper.session_dependency():
+            stmt = select(
+                ShiftCompany.name, ShiftCompany.location, ShiftCompany.position, ShiftCompany.company
+            ).where(
+                tuple_(ShiftCompany.name, ShiftCompany.location, ShiftCompany.position).in_(series)
+            ).order_by(ShiftCompany.created_at)
+            result = await session.execute(stmt)
+            # Later rows win so a series follows the company it was most recently seen with
+            return {(name, location, position): company for name, location, position, company in result.all()}
+
+    async def save_batch(self, shift_companies: list[ShiftCompanyBase]) -> None:
+        if not shift_companies:
+            return
+        async for session in self.db_helper.session_dependency():
+            stmt = insert(ShiftCompany).values([
+                {
+                    'shift_link': shift_company.shift_link,
+                    'name': shift_company.name,
+                    'location': shift_company.location,
+                    'position': shift_company.position,
+                    'company': shift_company.company,
+                    'created_at': shift_company.created_at
+                }
+                for shift_company in shift_companies
+            ])
+            # A re-saved link moves to its latest series and timestamp, so series lookups see it as the newest row
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ShiftCompany.shift_link],
+                set_={
+                    'name': stmt.excluded.name,
+                    'location': stmt.excluded.location,
+                    'position': stmt.excluded.position,
+                    'company': stmt.excluded.company,
+                    'created_at': stmt.excluded.created_at
+                }
+            )
+            await session.execute(stmt)
+            await session.commit()
@@ -2,6 +2,8 @@ from .base import Base
 from .user import User
 from .filter import Filter, FilterCompany, FilterLocation, FilterPosition
 from .mute import Mute
+from .shift_company import ShiftCompany
+from .outbox_message import OutboxMessage
 
 __all__ = [
     "Base",
@@ -10,5 +12,7 @@ __all__ = [
     "FilterCompany", 
     "FilterLocation",
     "FilterPosition",
-    "Mute"
+    "Mute",
+    "ShiftCompany",
+    "OutboxMessage"
 ]
@@ -0,0 +1,20 @@
+from sqlalchemy import Integer, String, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from .base import Base
+
+
+class ShiftCompany(Base):
+    __tablename__ = "shift_companies"
+
+    shift_link: Mapped[int] = mapped_column(Integer, unique=True, nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=True)
+    location: Mapped[str] = mapped_column(String(255), nullable=True)
+    position: Mapped[str] = mapped_column(String(255), nullable=True)
+    company: Mapped[str] = mapped_column(String(255), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Secondary lookup for recurring shift series
+    __table_args__ = (
+        Index('ix_shift_companies_series', 'name', 'location', 'position'),
+    )
@@ -1 +1,2 @@
 from .selenium_exceptions import *
+from .http_exceptions import *
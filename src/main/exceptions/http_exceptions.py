@@ -0,0 +1,19 @@
+class HttpBaseException(Exception):
+    def __init__(self, message: str = "HTTP error occurred"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class HttpFetchException(HttpBaseException):
+    def __init__(self, message: str = "Failed to fetch page"):
+        super().__init__(message)
+
+
+class HttpSessionExpiredException(HttpBaseException):
+    def __init__(self, message: str = "HTTP session expired"):
+        super().__init__(message)
+
+
+class HttpUnrenderedPageException(HttpFetchException):
+    def __init__(self, message: str = "Page has neither shift rows nor a total"):
+        super().__init__(message)
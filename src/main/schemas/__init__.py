@@ -1,4 +1,7 @@
 from .filter import FilterBase, ListFieldBase
-from .shift import ShiftBase
+from .shift import ShiftBase, ShiftPage, ShiftPageDelta
+from .shift_event import ShiftEvent, ShiftEventType
 from .user import UserBase
 from .mute import MuteBase
+from .shift_company import ShiftCompanyBase
+from .outbox_message import OutboxMessageBase, OutboxStatus
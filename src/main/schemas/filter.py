@@ -20,4 +20,6 @@ class FilterBase:
     positions: List[ListFieldBase] = field(default_factory=list)
     longer: Optional[timedelta] = None
     shorter: Optional[timedelta] = None
+    # Changes whenever the filter is edited through FilterDAO, see FilterDAO.version
+    version: int = 0
 
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+@dataclass(init=True)
+class OutboxMessageBase:
+    id: Optional[int] = None
+    user_id: Optional[int] = None
+    chat_id: Optional[int] = None
+    shift_link: Optional[int] = None
+    text: Optional[str] = None
+    keyboard: Optional[str] = None
+    protect_content: bool = True
+    status: OutboxStatus = OutboxStatus.PENDING
+    attempts: int = 0
+    last_error: Optional[str] = None
+    available_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
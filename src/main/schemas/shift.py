@@ -1,9 +1,12 @@
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
 
 
-@dataclass(init=True)
+# Snapshots hold up to ~1,800 shifts whose names, locations and positions repeat heavily, so shifts
+# are immutable, slotted, share interned strings and compute their hash once.
+@dataclass(init=True, frozen=True, slots=True, eq=False)
 class ShiftBase:
     name: Optional[str] = None
     start: Optional[datetime] = None
@@ -15,25 +18,66 @@ class ShiftBase:
     link: int = None
     position: str = None
     is_bind: bool = False
-    connected_shifts: list['ShiftBase'] = field(default_factory=list)
+    connected_shifts: tuple['ShiftBase', ...] = ()
+    _hash: int = field(init=False, repr=False, default=0)
+
+    def __post_init__(self) -> None:
+        for field_name in _INTERNED_FIELDS:
+            value = getattr(self, field_name)
+            if value is not None:
+                object.__setattr__(self, field_name, sys.intern(value))
+        if not isinstance(self.connected_shifts, tuple):
+            object.__setattr__(self, 'connected_shifts', tuple(self.connected_shifts))
+        object.__setattr__(self, '_hash', hash(
+            (self.name, self.start, self.end, self.location, self.company, self.max_occupy, self.link,
+             *(c_shift._hash for c_shift in self.connected_shifts))
+        ))
+
+    # Rebuild through __init__ so a copy coming from a worker process is re-interned and re-hashed
+    # with this process's hash seed
+    def __reduce__(self):
+        return ShiftBase, (self.name, self.start, self.end, self.location, self.company, self.occupied,
+                           self.max_occupy, self.link, self.position, self.is_bind, self.connected_shifts)
+
+    def fingerprint(self) -> tuple:
+        return (self.name, self.start, self.end, self.location, self.company, self.occupied, self.max_occupy,
+                self.position, self.is_bind, tuple(c_shift.fingerprint() for c_shift in self.connected_shifts))
 
+    # Equality and the hash identify the shift and leave out occupied and position as before, so a shift
+    # whose occupancy moved is still the same shift. Anything that has to see those fields compares
+    # fingerprint() instead: page deltas, the snapshot store behind SEATS_FREED and the render cache.
     def __hash__(self) -> int:
-        connected_shifts_hash = list()
-        for c_shift in self.connected_shifts:
-            connected_shifts_hash.append(c_shift.__hash__())
-        return hash(
-            (self.name, self.start, self.end, self.location, self.company, self.max_occupy, self.link, *connected_shifts_hash)
-        )
-    
+        return self._hash
+
     def __eq__(self, other) -> bool:
         if not isinstance(other, ShiftBase):
             return False
-        return (self.name == other.name and 
-                self.start == other.start and 
-                self.end == other.end and 
-                self.location == other.location and 
-                self.company == other.company and
-                self.max_occupy == other.max_occupy and 
+        return (self._hash == other._hash and
                 self.link == other.link and
-                set(self.connected_shifts) - set(other.connected_shifts)) == set()
-    
+                self.name == other.name and
+                self.start == other.start and
+                self.end == other.end and
+                self.location == other.location and
+                self.company == other.company and
+                self.max_occupy == other.max_occupy and
+                self.connected_shifts == other.connected_shifts)
+
+
+_INTERNED_FIELDS = ("name", "location", "company", "position")
+
+
+@dataclass(init=True)
+class ShiftPage:
+    page: int
+    rows: list[tuple[ShiftBase, bool]] = field(default_factory=list)
+    total: Optional[int] = None
+
+
+@dataclass(init=True)
+class ShiftPageDelta:
+    page: int
+    version: str
+    base_version: Optional[str] = None
+    order: Optional[list[tuple[int, bool]]] = None
+    upserts: list[ShiftBase] = field(default_factory=list)
+    total: Optional[int] = None
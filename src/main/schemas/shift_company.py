@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(init=True)
+class ShiftCompanyBase:
+    id: Optional[int] = None
+    shift_link: Optional[int] = None
+    name: Optional[str] = None
+    location: Optional[str] = None
+    position: Optional[str] = None
+    company: Optional[str] = None
+    created_at: Optional[datetime] = None
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+from .shift import ShiftBase
+
+
+class ShiftEventType(str, Enum):
+    NEW = "new"
+    REMOVED = "removed"
+    SEATS_FREED = "seats_freed"
+    RESCHEDULED = "rescheduled"
+
+
+@dataclass(init=True)
+class ShiftEvent:
+    type: ShiftEventType
+    link: int
+    shift: Optional[ShiftBase] = None
+    previous_occupied: Optional[int] = None
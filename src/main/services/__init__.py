@@ -1,4 +1,6 @@
 from .message_service import MessageService
 from .shift_service import ShiftService
 from .user_service import UserService
-from .mute_service import MuteService
\ No newline at end of file
+from .mute_service import MuteService
+from .company_cache_service import CompanyCacheService
+from .outbox_service import OutboxService
@@ -0,0 +1,124 @@
+import logging
+from collections import OrderedDict
+from datetime import datetime
+
+from src.main.dao import ShiftCompanyDAO
+from src.main.schemas import ShiftBase, ShiftCompanyBase
+from src.main.utils import Metrics
+from src.main.utils.db_helper import DatabaseHelper
+
+
+class CompanyCacheService:
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(CompanyCacheService, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, db_helper: DatabaseHelper, max_size: int = 5000):
+        if not hasattr(self, '_initialized'):
+            self._initialized = True
+            self._shift_company_dao = ShiftCompanyDAO(db_helper)
+            self._max_size = max_size
+            self._by_link: OrderedDict[int, str] = OrderedDict()
+            self._by_series: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+            self.metrics = Metrics("company_cache")
+
+    @classmethod
+    def initialize(cls, db_helper: DatabaseHelper):
+        if cls._instance:
+            raise RuntimeError("CompanyCacheService is already initialized. Use get_instance() to access it.")
+        cls._instance = cls(db_helper)
+
+    @classmethod
+    def get_instance(cls) -> 'CompanyCacheService':
+        if not cls._instance:
+            raise RuntimeError("CompanyCacheService is not initialized. Call initialize() first.")
+        return cls._instance
+
+    # A series needs all three fields, NULL never matches in the database lookup
+    @staticmethod
+    def series_key(shift: ShiftBase) -> tuple[str, str, str] | None:
+        key = shift.name, shift.location, shift.position
+        return None if None in key else key
+
+    def _remember(self, cache: OrderedDict, key, company: str) -> None:
+        cache[key] = company
+        cache.move_to_end(key)
+        if len(cache) > self._max_size:
+            cache.popitem(last=False)
+
+    def _lookup(self, cache: OrderedDict, key) -> str | None:
+        company = cache.get(key)
+        if company is not None:
+            cache.move_to_end(key)
+        return company
+
+    async def get_companies(self, shifts: list[ShiftBase]) -> dict[int, str]:
+        companies: dict[int, str] = dict()
+        missing: list[ShiftBase] = []
+        for shift in shifts:
+            company = self._lookup(self._by_link, shift.link)
+            if company is None:
+                missing.append(shift)
+            else:
+                companies[shift.link] = company
+                self.metrics.increment("memory_hits")
+
+        if missing:
+            try:
+                stored = await self._shift_company_dao.get_batch_by_links([shift.link for shift in missing])
+                for shift in missing:
+                    if shift.link in stored:
+                        companies[shift.link] = stored[shift.link]
+                        self._remember(self._by_link, shift.link, stored[shift.link])
+                        self.metrics.increment("db_hits")
+                missing = [shift for shift in missing if shift.link not in companies]
+
+                series_missing = [
+                    key for key in map(self.series_key, missing)
+                    if key is not None and self._lookup(self._by_series, key) is None
+                ]
+                if series_missing:
+                    series = await self._shift_company_dao.get_batch_by_series(list(set(series_missing)))
+                    for key, company in series.items():
+                        self._remember(self._by_series, key, company)
+            except Exception as e:
+                logging.error(f"Failed to read company cache from database: {e}")
+
+            for shift in missing:
+                key = self.series_key(shift)
+                company = None if key is None else self._lookup(self._by_series, key)
+                if company is None:
+                    self.metrics.increment("misses")
+                else:
+                    companies[shift.link] = company
+                    self._remember(self._by_link, shift.link, company)
+                    self.metrics.increment("series_hits")
+
+        return companies
+
+    async def store_companies(self, shifts: list[ShiftBase]) -> None:
+        created_at = datetime.utcnow()
+        entries = []
+        for shift in shifts:
+            if not shift.company:
+                continue
+            self._remember(self._by_link, shift.link, shift.company)
+            key = self.series_key(shift)
+            if key is not None:
+                self._remember(self._by_series, key, shift.company)
+            entries.append(ShiftCompanyBase(
+                shift_link=shift.link,
+                name=shift.name,
+                location=shift.location,
+                position=shift.position,
+                company=shift.company,
+                created_at=created_at
+            ))
+
+        try:
+            await self._shift_company_dao.save_batch(entries)
+        except Exception as e:
+            logging.error(f"Failed to persist company cache: {e}")
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import logging
 
@@ -6,6 +7,7 @@ from aiogram.types import InlineKeyboardMarkup
 from dotenv import load_dotenv
 
 from src.main.dao import UserDAO
+from src.main.services.notification_dispatcher import DeliveryResult, Notification, NotificationDispatcher
 
 
 class MessageService:
@@ -16,7 +18,7 @@ class MessageService:
             cls._instance = super(MessageService, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self, user_dao: UserDAO):
+    def __init__(self, user_dao: UserDAO, dispatcher_options: dict | None = None):
         if not hasattr(self, '_initialized'):
             self._initialized = True
             self.user_dao = user_dao
@@ -25,12 +27,13 @@ class MessageService:
             if not token:
                 raise RuntimeError("TELEGRAM_BOT_TOKEN is not set in environment")
             self._bot = Bot(token=token)
+            self._dispatcher = NotificationDispatcher(self._send, **(dispatcher_options or {}))
 
     @classmethod
-    def initialize(cls, user_dao):
+    def initialize(cls, user_dao, dispatcher_options: dict | None = None):
         if cls._instance:
             raise RuntimeError("MessageService is already initialized. Use get_instance() to access it.")
-        cls._instance = cls(user_dao)
+        cls._instance = cls(user_dao, dispatcher_options)
 
     @classmethod
     def get_instance(cls) -> 'MessageService':
@@ -38,35 +41,52 @@ class MessageService:
             raise RuntimeError("MessageService is not initialized. Call initialize() first.")
         return cls._instance
 
+    @property
+    def metrics(self):
+        return self._dispatcher.metrics
+
+    async def _send(self, notification: Notification) -> None:
+        if notification.keyboard:
+            await self._bot.send_message(chat_id=notification.chat_id, text=notification.text,
+                                         reply_markup=notification.keyboard,
+                                         protect_content=notification.protect_content)
+        else:
+            await self._bot.send_message(chat_id=notification.chat_id,
+                                         text=notification.text,
+                                         protect_content=notification.protect_content)
+
+    async def flush(self) -> None:
+        await self._dispatcher.join()
+
+    # Gives queued messages up to timeout seconds to go out before the dispatcher and the bot session close
+    async def close(self, timeout: float = 10) -> None:
+        try:
+            await asyncio.wait_for(self._dispatcher.join(), timeout)
+        except asyncio.TimeoutError:
+            logging.warning(f"Dropping {self._dispatcher.queue_depth} queued messages on shutdown")
+        await self._dispatcher.stop()
+        await self._bot.session.close()
+
+    async def deliver(self, notification: Notification) -> DeliveryResult:
+        return await self._dispatcher.deliver(notification)
+
+    # A broadcast only queues the messages, waiting for thousands of rate-limited sends would hold the caller
     async def send_message_all_users(self, message: str, protect_content: bool = False) -> None:
         users = await self.user_dao.get_users_with_active_access()
         for user in users:
             if user.tg_id:
-                try:
-                    await self._bot.send_message(chat_id=user.tg_id, text=message, protect_content=protect_content)
-                except:
-                    pass
+                self._dispatcher.enqueue(Notification(chat_id=user.tg_id, text=message, protect_content=protect_content))
 
-    async def send_message_all_admin(self, message: str, protect_content: bool = False) -> None:
+    async def send_message_all_admin(self, message: str, protect_content: bool = False) -> list[DeliveryResult]:
         admins = await self.user_dao.get_admins()
-        for admin in admins:
-            try:
-                await self._bot.send_message(chat_id=admin.tg_id, text=message, protect_content=protect_content)
-            except:
-                pass
+        return await asyncio.gather(*(
+            self._dispatcher.enqueue(Notification(chat_id=admin.tg_id, text=message, protect_content=protect_content))
+            for admin in admins
+        ))
 
     async def send_message_specific_user(self, tg_id: int, message: str, keyboard: InlineKeyboardMarkup = None,
-                                         protect_content: bool = True) -> None:
+                                         protect_content: bool = True) -> DeliveryResult | None:
         if tg_id is None:
-            return
-        try:
-            if keyboard:
-                await self._bot.send_message(chat_id=tg_id, text=message,
-                                             reply_markup=keyboard,
-                                             protect_content=protect_content)
-            else:
-                await self._bot.send_message(chat_id=tg_id,
-                                             text=message,
-                                             protect_content=protect_content)
-        except:
-            pass
+            return None
+        return await self._dispatcher.enqueue(Notification(chat_id=tg_id, text=message, keyboard=keyboard,
+                                                           protect_content=protect_content))
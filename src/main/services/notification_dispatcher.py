@@ -0,0 +1,190 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, NamedTuple
+
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramForbiddenError,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError
+)
+
+from src.main.utils import Metrics, TokenBucket
+
+
+@dataclass(init=True)
+class Notification:
+    chat_id: int
+    text: str
+    keyboard: Any = None
+    protect_content: bool = True
+    attempts: int = 0
+    # Resolved with the final DeliveryResult once the dispatcher is done with the message
+    delivered: asyncio.Future | None = field(default=None, repr=False)
+
+
+class DeliveryStatus(str, Enum):
+    SENT = "sent"
+    RETRY = "retry"
+    FAILED = "failed"
+
+
+class DeliveryResult(NamedTuple):
+    status: DeliveryStatus
+    retry_after: float = 0.0
+    error: str | None = None
+
+
+# Telegram allows about 30 messages per second per bot and one per second per chat
+class NotificationDispatcher:
+
+    def __init__(self,
+                 send: Callable[[Notification], Awaitable[Any]],
+                 concurrency: int = 8,
+                 global_rate: float = 25,
+                 chat_rate: float = 1,
+                 chat_burst: float = 3,
+                 max_attempts: int = 3,
+                 max_queue_size: int = 10000):
+        self._send = send
+        self._concurrency = concurrency
+        self._send_slots = asyncio.Semaphore(concurrency)
+        self._max_attempts = max_attempts
+        self._global_bucket = TokenBucket(global_rate)
+        self._chat_rate = chat_rate
+        self._chat_burst = chat_burst
+        self._chat_buckets: dict[int, TokenBucket] = dict()
+        self._queue: asyncio.Queue[Notification] = asyncio.Queue(maxsize=max_queue_size)
+        self._workers: list[asyncio.Task] = []
+        self.metrics = Metrics("dispatcher")
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self._concurrency)]
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        while not self._queue.empty():
+            notification = self._queue.get_nowait()
+            self._queue.task_done()
+            self._resolve(notification, DeliveryResult(DeliveryStatus.FAILED, error="Dispatcher stopped"))
+
+    # The returned future can be awaited for the outcome, callers that only need to hand the message off
+    # can drop it
+    def enqueue(self, notification: Notification) -> asyncio.Future:
+        self.start()
+        if notification.delivered is None:
+            notification.delivered = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait(notification)
+        except asyncio.QueueFull:
+            self.metrics.increment("dropped_queue_full")
+            logging.warning(f"Notification queue is full, dropping message to {notification.chat_id}")
+            self._resolve(notification, DeliveryResult(DeliveryStatus.FAILED, error="Notification queue is full"))
+            return notification.delivered
+        self.metrics.set_gauge("queue_depth", self._queue.qsize())
+        return notification.delivered
+
+    async def join(self) -> None:
+        await self._queue.join()
+        self._prune_chat_buckets()
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = TokenBucket(self._chat_rate, self._chat_burst)
+        return bucket
+
+    def _prune_chat_buckets(self) -> None:
+        self._chat_buckets = {chat_id: bucket for chat_id, bucket in self._chat_buckets.items() if not bucket.is_idle}
+
+    async def _worker(self) -> None:
+        while True:
+            notification = await self._queue.get()
+            try:
+                result = await self.deliver(notification)
+                if result.status == DeliveryStatus.RETRY:
+                    if self._retry(notification, count_attempt=not result.retry_after):
+                        continue
+                    result = DeliveryResult(DeliveryStatus.FAILED, error=result.error)
+                self._resolve(notification, result)
+            except asyncio.CancelledError:
+                self._resolve(notification, DeliveryResult(DeliveryStatus.FAILED, error="Dispatcher stopped"))
+                raise
+            except Exception as e:
+                self.metrics.increment("dropped_error")
+                logging.error(f"Unexpected error delivering message to {notification.chat_id}: {e}")
+                self._resolve(notification, DeliveryResult(DeliveryStatus.FAILED, error=str(e)))
+            finally:
+                self._queue.task_done()
+                self.metrics.set_gauge("queue_depth", self._queue.qsize())
+
+    # One rate-limited attempt; retrying is up to the caller, so queued and outbox messages share the limits
+    async def deliver(self, notification: Notification) -> DeliveryResult:
+        async with self._send_slots:
+            return await self._deliver(notification)
+
+    async def _deliver(self, notification: Notification) -> DeliveryResult:
+        # Both tokens are taken together, so waiting on one bucket never spends a token of the other
+        chat_bucket = self._chat_bucket(notification.chat_id)
+        while (delay := max(chat_bucket.delay(), self._global_bucket.delay())) > 0:
+            await asyncio.sleep(delay)
+        chat_bucket.take()
+        self._global_bucket.take()
+        notification.attempts += 1
+        started_at = time.perf_counter()
+        try:
+            await self._send(notification)
+        except TelegramRetryAfter as e:
+            # Flood control holds the whole bot, the message waits it out without spending an attempt
+            self.metrics.increment("retry_after")
+            logging.warning(f"Flood control for {e.retry_after}s while sending to {notification.chat_id}")
+            self._global_bucket.pause(e.retry_after)
+            chat_bucket.pause(e.retry_after)
+            return DeliveryResult(DeliveryStatus.RETRY, retry_after=e.retry_after, error=str(e))
+        except TelegramForbiddenError as e:
+            self.metrics.increment("dropped_forbidden")
+            logging.debug(f"User {notification.chat_id} blocked the bot, dropping message")
+            return DeliveryResult(DeliveryStatus.FAILED, error=str(e))
+        except (TelegramNetworkError, TelegramServerError) as e:
+            logging.warning(f"Failed to send message to {notification.chat_id}: {e}")
+            return DeliveryResult(DeliveryStatus.RETRY, error=str(e))
+        except TelegramAPIError as e:
+            self.metrics.increment("dropped_error")
+            logging.warning(f"Telegram rejected message to {notification.chat_id}: {e}")
+            return DeliveryResult(DeliveryStatus.FAILED, error=str(e))
+        self.metrics.increment("sent")
+        self.metrics.observe("send", time.perf_counter() - started_at)
+        return DeliveryResult(DeliveryStatus.SENT)
+
+    def _retry(self, notification: Notification, count_attempt: bool = True) -> bool:
+        if not count_attempt:
+            notification.attempts -= 1
+        if notification.attempts >= self._max_attempts:
+            self.metrics.increment("dropped_attempts")
+            logging.warning(f"Giving up on message to {notification.chat_id} after {notification.attempts} attempts")
+            return False
+        try:
+            self._queue.put_nowait(notification)
+        except asyncio.QueueFull:
+            self.metrics.increment("dropped_queue_full")
+            return False
+        self.metrics.increment("requeued")
+        return True
+
+    @staticmethod
+    def _resolve(notification: Notification, result: DeliveryResult) -> None:
+        if notification.delivered is not None and not notification.delivered.done():
+            notification.delivered.set_result(result)
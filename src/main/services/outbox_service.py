@@ -0,0 +1,151 @@
+import asyncio
+import logging
+from datetime import timedelta
+
+from aiogram.types import InlineKeyboardMarkup
+
+from src.main.dao import OutboxDAO
+from src.main.schemas import OutboxMessageBase, OutboxStatus
+from src.main.services.message_service import MessageService
+from src.main.services.notification_dispatcher import DeliveryStatus, Notification
+from src.main.utils import Metrics
+from src.main.utils.db_helper import DatabaseHelper
+
+
+class OutboxService:
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super(OutboxService, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self,
+                 db_helper: DatabaseHelper,
+                 workers: int = 2,
+                 batch_size: int = 25,
+                 max_attempts: int = 5):
+        if not hasattr(self, '_initialized'):
+            self._initialized = True
+            self._outbox_dao = OutboxDAO(db_helper)
+            self._workers = workers
+            self._batch_size = batch_size
+            self._max_attempts = max_attempts
+            self._poll_timeout = 1
+            self._retry_timeout = 30
+            self._cleanup_timeout = 60
+            # A claimed batch has to be delivered within the lease, otherwise another worker takes it again
+            self._lease = timedelta(minutes=5)
+            self._retention = timedelta(days=1)
+            self._delivery_tasks: list[asyncio.Task] = []
+            self._cleanup_task = None
+            self._stopping = False
+            self.metrics = Metrics("outbox")
+
+    @classmethod
+    def initialize(cls,
+                   db_helper: DatabaseHelper,
+                   workers: int = 2,
+                   batch_size: int = 25,
+                   max_attempts: int = 5):
+        if cls._instance:
+            raise RuntimeError("OutboxService is already initialized. Use get_instance() to access it.")
+        cls._instance = cls(db_helper, workers, batch_size, max_attempts)
+
+    @classmethod
+    def get_instance(cls) -> 'OutboxService':
+        if not cls._instance:
+            raise RuntimeError("OutboxService is not initialized. Call initialize() first.")
+        return cls._instance
+
+    @staticmethod
+    def serialize_keyboard(keyboard: InlineKeyboardMarkup | None) -> str | None:
+        return keyboard.model_dump_json(exclude_none=True) if keyboard else None
+
+    @staticmethod
+    def deserialize_keyboard(keyboard: str | None) -> InlineKeyboardMarkup | None:
+        return InlineKeyboardMarkup.model_validate_json(keyboard) if keyboard else None
+
+    async def enqueue(self, messages: list[OutboxMessageBase]) -> None:
+        await self._outbox_dao.save_batch(messages)
+        self.metrics.increment("enqueued", len(messages))
+
+    # Delivery is at-least-once: a worker that crashes between sending a message and marking it sent
+    # leaves the row claimed, and it is sent again once the lease runs out
+    async def deliver_batch(self) -> int:
+        messages = await self._outbox_dao.claim_batch(self._batch_size, self._lease, self._max_attempts)
+        if not messages:
+            return 0
+        message_service = MessageService.get_instance()
+        try:
+            # Each delivery waits for a send slot and tokens of the dispatcher, which bounds the batch like queued sends
+            results = await asyncio.gather(*(
+                message_service.deliver(Notification(
+                    chat_id=message.chat_id,
+                    text=message.text,
+                    keyboard=OutboxService.deserialize_keyboard(message.keyboard),
+                    protect_content=message.protect_content
+                ))
+                for message in messages
+            ))
+        except asyncio.CancelledError:
+            # Stopped mid-batch: hand the rows back now rather than leaving them in "sending" until the lease runs
+            # out. Whatever already went out is sent again, as after a crash.
+            await self._outbox_dao.release([message.id for message in messages])
+            raise
+
+        sent_ids = []
+        for message, result in zip(messages, results):
+            if result.status == DeliveryStatus.SENT:
+                sent_ids.append(message.id)
+            elif result.status == DeliveryStatus.RETRY and (result.retry_after or message.attempts < self._max_attempts):
+                # Flood control is waited out without spending an attempt, other failures back off
+                delay = result.retry_after or self._retry_timeout * message.attempts
+                await self._outbox_dao.mark_retry(message.id, timedelta(seconds=delay), result.error,
+                                                  count_attempt=not result.retry_after)
+                self.metrics.increment("retried")
+            else:
+                await self._outbox_dao.mark_failed(message.id, result.error)
+                self.metrics.increment("failed")
+        await self._outbox_dao.mark_sent(sent_ids)
+        self.metrics.increment("sent", len(sent_ids))
+        return len(messages)
+
+    async def delivery_task(self, worker_id: int) -> None:
+        while not self._stopping:
+            try:
+                delivered = await self.deliver_batch()
+            except Exception as e:
+                logging.error(f"Outbox delivery worker {worker_id} failed: {e}")
+                delivered = 0
+            if not delivered and not self._stopping:
+                await asyncio.sleep(self._poll_timeout)
+
+    async def cleanup_task(self) -> None:
+        while True:
+            try:
+                counts = await self._outbox_dao.count_by_status()
+                for status in OutboxStatus:
+                    self.metrics.set_gauge(status.value, counts.get(status, 0))
+                logging.info(self.metrics.format())
+                await self._outbox_dao.cleanup_delivered(self._retention)
+            except Exception as e:
+                logging.error(f"Outbox cleanup failed: {e}")
+            await asyncio.sleep(self._cleanup_timeout * 60)
+
+    async def run(self) -> None:
+        self._delivery_tasks = [asyncio.create_task(self.delivery_task(worker_id)) for worker_id in range(self._workers)]
+        self._cleanup_task = asyncio.create_task(self.cleanup_task())
+
+    # Lets the workers finish the batch they hold for up to timeout seconds, then cancels them
+    async def stop(self, timeout: float = 10) -> None:
+        self._stopping = True
+        if self._cleanup_task:
+            self._cleanup_task.cancel()
+        if self._delivery_tasks:
+            _, pending = await asyncio.wait(self._delivery_tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+        await asyncio.gather(*self._delivery_tasks, *filter(None, [self._cleanup_task]), return_exceptions=True)
+        self._delivery_tasks = []
+        self._cleanup_task = None
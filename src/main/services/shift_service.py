@@ -1,15 +1,19 @@
 import asyncio
-import copy
 import logging
 import time
+from dataclasses import replace
 from datetime import datetime
 
 from src.main.clients import SeleniumClient
 from src.main.dao import UserDAO, FilterDAO
 from src.main.handlers.keyboards import shift_mute_keyboard
-from src.main.schemas import ShiftBase, FilterBase
+from src.main.schemas import ShiftBase, FilterBase, OutboxMessageBase, ShiftEvent, ShiftEventType
 from src.main.services.message_service import MessageService
 from src.main.services.mute_service import MuteService
+from src.main.services.notification_dispatcher import DeliveryStatus
+from src.main.services.outbox_service import OutboxService
+from src.main.services.company_cache_service import CompanyCacheService
+from src.main.utils import Metrics, ShiftRenderCache, ShiftSnapshotStore, SubscriptionIndex
 from src.main.exceptions.selenium_exceptions import (
     SeleniumCommandException,
     SeleniumCommandTimeoutException,
@@ -28,11 +32,14 @@ class ShiftService:
     def __init__(self,
                  user_dao: UserDAO,
                  filter_dao: FilterDAO,
-                 selenium_client: SeleniumClient):
+                 selenium_client: SeleniumClient,
+                 notify_seats_freed: bool = False):
         if not hasattr(self, '_initialized'):
             self._initialized = True
             self._search_timeout = 10
-            self._login_timeout = 30
+            self._watch_timeout = 1
+            self._health_check_timeout = 1
+            self._recycle_timeout = 6 * 60
             self._mute_clean_timeout = 60
             self._driver = None
             self._login_task = None
@@ -41,14 +48,21 @@ class ShiftService:
             self._user_dao = user_dao
             self._filter_dao = filter_dao
             self._selenium_client = selenium_client
-            self._existing_shift_links: set[int] = set()        
+            self._snapshot = ShiftSnapshotStore()
+            self._filter_signatures = dict()
+            self._notify_seats_freed = notify_seats_freed
+            self.metrics = Metrics("search")
             self._driver_mutex = asyncio.Lock()
     
     @classmethod
-    def initialize(cls, user_dao: UserDAO, filter_dao: FilterDAO, selenium_client: SeleniumClient):
+    def initialize(cls,
+                   user_dao: UserDAO,
+                   filter_dao: FilterDAO,
+                   selenium_client: SeleniumClient,
+                   notify_seats_freed: bool = False):
         if cls._instance:
             raise RuntimeError("ShiftService is already initialized. Use get_instance() to access it.")
-        cls._instance = cls(user_dao, filter_dao, selenium_client)
+        cls._instance = cls(user_dao, filter_dao, selenium_client, notify_seats_freed)
     
     @classmethod
     def get_instance(cls) -> 'ShiftService':
@@ -72,8 +86,10 @@ class ShiftService:
             
             admin_message += f"\n⚠️ Требуется вмешательство администратора!"
             
-            await message_service.send_message_all_admin(admin_message, protect_content=False)
-            logging.critical(f"Critical error in ShiftService: {error_type} - {error_message}", exc_info=exception)
+            results = await message_service.send_message_all_admin(admin_message, protect_content=False)
+            notified = sum(result.status == DeliveryStatus.SENT for result in results)
+            logging.critical(f"Critical error in ShiftService: {error_type} - {error_message} "
+                             f"(notified {notified} of {len(results)} admins)", exc_info=exception)
             
         except Exception as e:
             logging.error(f"Failed to notify admins about critical error: {e}")
@@ -89,52 +105,83 @@ class ShiftService:
         await ShiftService._notify_admins_critical_error(error_type, error_message, exception)
 
     async def login(self) -> None:
-        async with self._driver_mutex:
-            try:
-                self._selenium_client.close_driver()
-                await self._selenium_client.start_process()
-            except (SeleniumCommandException, SeleniumCommandTimeoutException) as e:
-                await self._handle_selenium_error("Ошибка входа", e)
-            except Exception as e:
-                await self._notify_admins_critical_error("Неожиданная ошибка входа", str(e), e)
+        try:
+            if not await self._selenium_client.recycle():
+                # Restarting in place takes the pool away, searches wait instead of failing on it
+                async with self._driver_mutex:
+                    await self._selenium_client.restart()
+        except (SeleniumCommandException, SeleniumCommandTimeoutException) as e:
+            await self._handle_selenium_error("Ошибка входа", e)
+        except Exception as e:
+            await self._notify_admins_critical_error("Неожиданная ошибка входа", str(e), e)
 
-    async def find_new_shifts(self) -> list[ShiftBase]:
+    async def find_shift_events(self) -> list[ShiftEvent]:
         async with self._driver_mutex:
             try:
-                latest_shifts: dict[int, ShiftBase] = dict()
-                shifts = await self._selenium_client.parse_shifts()
-                
-                for shift in shifts:
-                    latest_shifts[shift.link] = shift
-                
-                if not len(latest_shifts):
-                    logging.info("No shifts parsed from website")
+                if self._selenium_client.watch_mode:
+                    shifts = await self._selenium_client.watch_shifts()
                 else:
-                    logging.info(f"Successfully parsed {len(latest_shifts)} shifts")
+                    shifts = await self._selenium_client.parse_shifts()
                 
-                if len(self._existing_shift_links) > 0:
-                    latest_shift_links = set(latest_shifts.keys())
-                    new_shift_links = latest_shift_links - self._existing_shift_links
-                    shift_list = set([latest_shifts[shift_link] for shift_link in new_shift_links])
-                    for shift in shift_list:
-                        shift.company = await self._selenium_client.parse_company_name(shift.link)
-                    
-                    self._existing_shift_links = latest_shift_links
-                    return list(shift_list)
+                if not shifts:
+                    logging.info("No shifts parsed from website")
                 else:
-                    self._existing_shift_links = set(latest_shifts.keys())
-                    return list()
+                    logging.info(f"Successfully parsed {len(shifts)} shifts")
+                logging.debug(self._selenium_client.metrics.format())
+
+                # The baseline moves on only once the events are ready to be handed out, otherwise a failed
+                # company lookup would swallow them for good
+                snapshot_diff = self._snapshot.diff(shifts, self._selenium_client.changed_links)
+                events = snapshot_diff.events
+                resolved = await self._resolve_companies([
+                    event.shift for event in events
+                    if event.type == ShiftEventType.NEW
+                    or (event.type == ShiftEventType.SEATS_FREED and self._notify_seats_freed)
+                ])
+                for event in events:
+                    event.shift = resolved.get(event.link, event.shift)
+                self._snapshot.commit(snapshot_diff)
+                self._selenium_client.acknowledge_changes()
+                if events:
+                    logging.info(self._snapshot.metrics.format())
+                return events
             except SeleniumWebDriverNotReadyException:
                 return []
             except (SeleniumCommandException, SeleniumCommandTimeoutException) as e:
-                logging.error(f"Critical error in find_new_shifts: {e}")
+                logging.error(f"Critical error in find_shift_events: {e}")
                 await self._handle_selenium_error("Ошибка поиска смен", e)
                 return []
             except Exception as e:
-                logging.error(f"Unexpected error in find_new_shifts: {e}")
+                logging.error(f"Unexpected error in find_shift_events: {e}")
                 await self._notify_admins_critical_error("Неожиданная ошибка поиска смен", str(e), e)
                 return []
 
+    async def _resolve_companies(self, shift_list: list[ShiftBase]) -> dict[int, ShiftBase]:
+        # The API payload may already carry the company, only the rest needs the cache or a detail page
+        resolved = {shift.link: shift for shift in shift_list if shift.company}
+        shift_list = [shift for shift in shift_list if not shift.company]
+        company_cache = CompanyCacheService.get_instance()
+        companies = await company_cache.get_companies(shift_list)
+
+        # Lookups queue up per worker, a failed one only leaves that shift without a company
+        missing = [shift for shift in shift_list if shift.link not in companies]
+        company_names = await asyncio.gather(
+            *(self._selenium_client.parse_company_name(shift.link) for shift in missing),
+            return_exceptions=True
+        )
+        for shift, company_name in zip(missing, company_names):
+            if isinstance(company_name, Exception):
+                logging.warning(f"Failed to resolve company of shift {shift.link}: {company_name}")
+                company_name = None
+            companies[shift.link] = company_name
+
+        resolved.update({shift.link: replace(shift, company=companies.get(shift.link)) for shift in shift_list})
+
+        await company_cache.store_companies([resolved[shift.link] for shift in missing])
+        if shift_list:
+            logging.info(company_cache.metrics.format())
+        return resolved
+
     @staticmethod
     def format_shift_for_telegram(shift: ShiftBase) -> str:
         message_parts = []
@@ -221,57 +268,14 @@ class ShiftService:
         
         return "\n".join(message_parts)
 
-    @staticmethod
-    def filter_new_shifts(shift_list: list[ShiftBase], shift_filter: FilterBase) -> list[ShiftBase]:
-        final_shift_list = list()
-        for shift in shift_list:
-            if ShiftService._shift_matches_filter(shift, shift_filter):
-                if len(
-                        ShiftService.filter_new_shifts(shift.connected_shifts, shift_filter)
-                ) != len(shift.connected_shifts):
-                    continue
-                final_shift_list.append(shift)
-        return final_shift_list
-
-    @staticmethod
-    def _shift_matches_filter(shift: ShiftBase, shift_filter: FilterBase) -> bool:
-        conditions = []
-        
-        if shift_filter.longer:
-            conditions.append(shift_filter.longer < (shift.end - shift.start))
-
-        if shift_filter.shorter:
-            conditions.append(shift_filter.shorter > (shift.end - shift.start))
-
-        if shift_filter.companies:
-            company_values = [company.value for company in shift_filter.companies]
-            conditions.append(shift.company and shift.company in company_values)
-
-        if shift_filter.locations:
-            location_values = [location.value for location in shift_filter.locations]
-            conditions.append(shift.location in location_values)
-
-        if shift_filter.positions:
-            position_values = [position.value for position in shift_filter.positions]
-            conditions.append(shift.position in position_values)
-        
-        if not conditions:
-            return True
-        
-        if shift_filter.is_and:
-            if shift_filter.is_black_list:
-                return not all(conditions)
-            else:
-                return all(conditions)
-        else:
-            if shift_filter.is_black_list:
-                return not any(conditions)
-            else:
-                return any(conditions)
-
     async def search(self) -> None:
         start_time = time.time()
-        new_shifts = await self.find_new_shifts()
+        events = await self.find_shift_events()
+        new_shifts = [event.shift for event in events if event.type == ShiftEventType.NEW]
+        freed_shifts = [event.shift for event in events if event.type == ShiftEventType.SEATS_FREED]
+        if not self._notify_seats_freed:
+            freed_shifts = []
+        freed_links = {shift.link for shift in freed_shifts}
 
         # from datetime import datetime, timedelta
         # test_shift = ShiftBase(
@@ -289,7 +293,11 @@ class ShiftService:
         # )
         # new_shifts.append(test_shift)
 
-        logging.info(f"Found {len(new_shifts)} new shifts in {time.time() - start_time:.2f} seconds")
+        logging.info(f"Found {len(new_shifts)} new shifts and {len(freed_shifts)} shifts with freed seats "
+                     f"in {time.time() - start_time:.2f} seconds")
+        new_shifts = new_shifts + freed_shifts
+        if not new_shifts:
+            return
 
         active_users = await self._user_dao.get_users_with_active_access()
         if not active_users:
@@ -298,36 +306,50 @@ class ShiftService:
 
         user_filters = await self._filter_dao.get_batch_user_filters([active_user.id for active_user in active_users])
 
-        for user in active_users:
-            filters = user_filters[user.id]
-            user_shifts = copy.deepcopy(new_shifts)
-
-            if len(filters) == 2:
-                if filters[0].is_black_list:
-                    user_shifts = ShiftService.filter_new_shifts(user_shifts, filters[1])
-                    user_shifts = ShiftService.filter_new_shifts(user_shifts, filters[0])
-                else:
-                    user_shifts = ShiftService.filter_new_shifts(user_shifts, filters[0])
-                    user_shifts = ShiftService.filter_new_shifts(user_shifts, filters[1])
+        subscription_index = SubscriptionIndex({user.id: user_filters[user.id] for user in active_users},
+                                               signature_cache=self._filter_signatures)
+        matched_shifts = subscription_index.match_shifts(new_shifts)
+        self.metrics.set_gauge("users", subscription_index.user_count)
+        self.metrics.set_gauge("filter_groups", subscription_index.group_count)
+        self.metrics.set_gauge("matched_users", len(matched_shifts))
+        logging.info(self.metrics.format())
 
-            mute_service = MuteService.get_instance()
-            user_mutes = await mute_service.get_batch_user_mutes([user.id])
+        render_cache = ShiftRenderCache(
+            ShiftService.format_shift_for_telegram,
+            lambda shift_link: OutboxService.serialize_keyboard(shift_mute_keyboard(shift_link))
+        )
+        user_mutes = await MuteService.get_instance().get_batch_user_mutes(list(matched_shifts))
+        messages = []
+        for user in active_users:
+            if user.id not in matched_shifts or user.tg_id is None:
+                continue
             muted_shifts = user_mutes.get(user.id, set())
 
-            for shift in user_shifts:
+            for shift in matched_shifts[user.id]:
                 if shift.link not in muted_shifts:
-                    formatted_message = ShiftService.format_shift_for_telegram(shift)
-                    mute_keyboard = shift_mute_keyboard(shift.link)
-                    await MessageService.get_instance().send_message_specific_user(
-                        user.tg_id,
-                        message=formatted_message,
-                        keyboard=mute_keyboard
+                    rendered = render_cache.render(
+                        shift, "🟢 Освободилось место" if shift.link in freed_links else None
                     )
+                    messages.append(OutboxMessageBase(
+                        user_id=user.id,
+                        chat_id=user.tg_id,
+                        shift_link=shift.link,
+                        text=rendered.text,
+                        keyboard=rendered.keyboard
+                    ))
+        logging.info(render_cache.metrics.format())
+        # Delivery workers pick the messages up from the outbox, so the next search does not wait for them
+        await OutboxService.get_instance().enqueue(messages)
+        logging.info(f"Queued {len(messages)} notifications")
 
     async def login_task(self) -> None:
+        await self.login()
+        last_login = time.monotonic()
         while True:
-            await self.login()
-            await asyncio.sleep(self._login_timeout * 60)
+            await asyncio.sleep(self._health_check_timeout * 60)
+            if not self._selenium_client.is_ready or time.monotonic() - last_login > self._recycle_timeout * 60:
+                await self.login()
+                last_login = time.monotonic()
 
     async def mute_cleanup_task(self) -> None:
         while True:
@@ -338,8 +360,15 @@ class ShiftService:
     async def search_task(self) -> None:
         while True:
             await self.search()
-            logging.info(f"Search task completed, sleeping for {self._search_timeout} seconds")
-            await asyncio.sleep(self._search_timeout)
+            search_timeout = self._watch_timeout if self._selenium_client.watch_mode else self._search_timeout
+            logging.info(f"Search task completed, sleeping for {search_timeout} seconds")
+            await asyncio.sleep(search_timeout)
+
+    async def stop(self) -> None:
+        for task in (self._login_task, self._search_task, self._mute_cleanup_task):
+            if task:
+                task.cancel()
+        await self._selenium_client.close()
 
     async def run(self) -> None:
         try:
@@ -1,6 +1,16 @@
 from .db_helper import DatabaseHelper
-from .shift_converter import ShiftConverter
-
-__all__ = ["DatabaseHelper", "ShiftConverter"]
-
+from .shift_converter import ShiftConverter, ShiftCollector
+from .metrics import Metrics
+from .shift_paginator import ShiftPaginator
+from .page_delta import PageDeltaEncoder, PageDeltaDecoder
+from .shift_snapshot_store import ShiftSnapshotStore
+from .fixture_corpus import FixtureCorpus, sanitize_html, sanitize_json
+from .shift_filter import filter_signature, subscription_signature
+from .subscription_index import SubscriptionIndex
+from .shift_render_cache import RenderedShift, ShiftRenderCache
+from .token_bucket import TokenBucket
 
+__all__ = ["DatabaseHelper", "ShiftConverter", "ShiftCollector", "Metrics", "ShiftPaginator",
+           "PageDeltaEncoder", "PageDeltaDecoder", "ShiftSnapshotStore", "FixtureCorpus", "sanitize_html",
+           "sanitize_json", "filter_signature", "subscription_signature", "SubscriptionIndex", "RenderedShift",
+           "ShiftRenderCache", "TokenBucket"]
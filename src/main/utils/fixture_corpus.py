@@ -0,0 +1,113 @@
+import json
+import os
+import re
+from datetime import datetime
+
+CORPUS_FORMAT = 1
+SCRIPT_TAG_PATTERN = re.compile(r'<script\b[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+INPUT_VALUE_PATTERN = re.compile(r'(<input\b[^>]*?\svalue=)("[^"]*"|\'[^\']*\')', re.IGNORECASE)
+
+
+def sanitize_html(html: str, secrets: list[str] | None = None) -> str:
+    # Inline scripts can carry session tokens and inputs the login form values, neither is needed for parsing
+    html = SCRIPT_TAG_PATTERN.sub('', html)
+    html = INPUT_VALUE_PATTERN.sub(r'\1""', html)
+    return redact_secrets(html, secrets)
+
+
+# JSON captures hold the same text as the page, a secret may show up there escaped as a JSON string
+def sanitize_json(text: str, secrets: list[str] | None = None) -> str:
+    escaped = [json.dumps(secret)[1:-1] for secret in secrets or [] if secret]
+    return redact_secrets(redact_secrets(text, secrets), escaped)
+
+
+def redact_secrets(text: str, secrets: list[str] | None = None) -> str:
+    for secret in secrets or []:
+        if secret:
+            text = text.replace(secret, "<redacted>")
+    return text
+
+
+class FixtureCorpus:
+
+    def __init__(self, path: str, secrets: list[str] | None = None):
+        self.path = path
+        self.secrets = secrets or []
+        self._manifest_path = os.path.join(path, "manifest.json")
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> dict:
+        if not os.path.exists(self._manifest_path):
+            return {"format": CORPUS_FORMAT, "captured_at": None, "list_pages": {}, "detail_pages": {}}
+        with open(self._manifest_path, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+        if manifest.get("format") != CORPUS_FORMAT:
+            raise ValueError(f"Unsupported fixture corpus format {manifest.get('format')} in {self.path}")
+        return manifest
+
+    def _write(self, relative_path: str, content: str) -> None:
+        path = os.path.join(self.path, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(content)
+        os.replace(temp_path, path)
+
+    def _save_manifest(self) -> None:
+        self.manifest["captured_at"] = datetime.now().isoformat(timespec="seconds")
+        self._write("manifest.json", json.dumps(self.manifest, indent=2, sort_keys=True))
+
+    def _read(self, relative_path: str) -> str:
+        with open(os.path.join(self.path, relative_path), "r", encoding="utf-8") as file:
+            return file.read()
+
+    def save_list_page(self, page: int, html: str, extracted_rows: str | None = None) -> None:
+        entry = {"html": f"list/page_{page}.html"}
+        self._write(entry["html"], sanitize_html(html, self.secrets))
+        if extracted_rows is not None:
+            entry["rows"] = f"list/page_{page}.rows.json"
+            self._write(entry["rows"], sanitize_json(extracted_rows, self.secrets))
+        self.manifest["list_pages"][str(page)] = entry
+        self._save_manifest()
+
+    # The board API response the page was rendered from, recorded next to its rows so the XHR field
+    # mapping can be checked against what the DOM showed
+    def save_xhr_payload(self, page: int, payload: str) -> None:
+        entry = self.manifest["list_pages"].setdefault(str(page), {})
+        entry["xhr"] = f"list/page_{page}.xhr.json"
+        self._write(entry["xhr"], sanitize_json(payload, self.secrets))
+        self._save_manifest()
+
+    def save_detail_page(self, link: int, html: str, company: str | None) -> None:
+        entry = {"html": f"detail/{link}.html", "company": company}
+        self._write(entry["html"], sanitize_html(html, self.secrets))
+        self.manifest["detail_pages"][str(link)] = entry
+        self._save_manifest()
+
+    @property
+    def list_pages(self) -> list[int]:
+        return sorted(int(page) for page in self.manifest["list_pages"])
+
+    @property
+    def detail_links(self) -> list[int]:
+        return sorted(int(link) for link in self.manifest["detail_pages"])
+
+    def load_list_page(self, page: int) -> str | None:
+        entry = self.manifest["list_pages"].get(str(page))
+        return self._read(entry["html"]) if entry and entry.get("html") else None
+
+    def load_extracted_rows(self, page: int) -> str | None:
+        entry = self.manifest["list_pages"].get(str(page))
+        return self._read(entry["rows"]) if entry and entry.get("rows") else None
+
+    def load_xhr_payload(self, page: int) -> str | None:
+        entry = self.manifest["list_pages"].get(str(page))
+        return self._read(entry["xhr"]) if entry and entry.get("xhr") else None
+
+    def load_detail_page(self, link: int) -> str | None:
+        entry = self.manifest["detail_pages"].get(str(link))
+        return self._read(entry["html"]) if entry else None
+
+    def recorded_company(self, link: int) -> str | None:
+        entry = self.manifest["detail_pages"].get(str(link))
+        return entry["company"] if entry else None
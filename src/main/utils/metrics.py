@@ -0,0 +1,41 @@
+class Metrics:
+
+    def __init__(self, name: str):
+        self.name = name
+        self._counters: dict[str, int] = dict()
+        self._gauges: dict[str, float] = dict()
+        self._timings: dict[str, tuple[int, float, float]] = dict()
+
+    def increment(self, key: str, value: int = 1) -> None:
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, key: str, value: float) -> None:
+        self._gauges[key] = value
+
+    def observe(self, key: str, seconds: float) -> None:
+        count, total, maximum = self._timings.get(key, (0, 0.0, 0.0))
+        self._timings[key] = (count + 1, total + seconds, max(maximum, seconds))
+
+    def counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    def snapshot(self) -> dict[str, float]:
+        result: dict[str, float] = dict(self._counters)
+        result.update(self._gauges)
+        for key, (count, total, maximum) in self._timings.items():
+            result[f"{key}_count"] = count
+            result[f"{key}_avg_ms"] = total / count * 1000 if count else 0.0
+            result[f"{key}_max_ms"] = maximum * 1000
+        return result
+
+    def format(self) -> str:
+        values = ", ".join(
+            f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+            for key, value in sorted(self.snapshot().items())
+        )
+        return f"{self.name}: {values}"
+
+    def reset(self) -> None:
+        self._counters.clear()
+        self._gauges.clear()
+        self._timings.clear()
@@ -0,0 +1,96 @@
+from typing import Iterable
+
+from ..schemas.shift import ShiftBase, ShiftPage, ShiftPageDelta
+
+
+class PageDeltaEncoder:
+
+    def __init__(self, prefix: str | int):
+        self._prefix = prefix
+        self._counter = 0
+        self._pages: dict[int, tuple[str, list[tuple[int, bool]], dict[int, tuple]]] = dict()
+
+    def encode(self, shift_page: ShiftPage, since: str | None = None) -> ShiftPageDelta:
+        order = [(shift.link, liquidating) for shift, liquidating in shift_page.rows]
+        shifts = {shift.link: shift for shift, _ in shift_page.rows}
+        fingerprints = {link: shift.fingerprint() for link, shift in shifts.items()}
+
+        previous = self._pages.get(shift_page.page)
+        if previous is None or previous[0] != since:
+            delta = ShiftPageDelta(page=shift_page.page, version=self._next_version(), order=order,
+                                   upserts=list(shifts.values()), total=shift_page.total)
+        else:
+            base_version, base_order, base_fingerprints = previous
+            upserts = [shift for link, shift in shifts.items() if base_fingerprints.get(link) != fingerprints[link]]
+            if not upserts and order == base_order:
+                return ShiftPageDelta(page=shift_page.page, version=base_version, base_version=base_version,
+                                      order=None, total=shift_page.total)
+            delta = ShiftPageDelta(page=shift_page.page, version=self._next_version(), base_version=base_version,
+                                   order=None if order == base_order else order, upserts=upserts,
+                                   total=shift_page.total)
+
+        self._pages[shift_page.page] = (delta.version, order, fingerprints)
+        return delta
+
+    def _next_version(self) -> str:
+        self._counter += 1
+        return f"{self._prefix}:{self._counter}"
+
+
+class PageDeltaDecoder:
+
+    def __init__(self):
+        self._pages: dict[int, tuple[str, list[tuple[int, bool]], dict[int, ShiftBase]]] = dict()
+        # Links whose rows changed since the last acknowledge, None until there is a baseline to compare to
+        self.changed_links: set[int] | None = None
+
+    @property
+    def pages(self) -> list[int]:
+        return list(self._pages)
+
+    def since(self, page: int) -> str | None:
+        snapshot = self._pages.get(page)
+        return snapshot[0] if snapshot else None
+
+    def apply(self, delta: ShiftPageDelta) -> ShiftPage:
+        if delta.base_version is None:
+            order, shifts = delta.order, dict()
+            previous = self._pages.get(delta.page)
+            self._track(order if previous is None else order + previous[1], delta.upserts)
+        else:
+            snapshot = self._pages.get(delta.page)
+            if snapshot is None or snapshot[0] != delta.base_version:
+                raise ValueError(f"Delta for page {delta.page} is based on unknown version {delta.base_version}")
+            _, base_order, base_shifts = snapshot
+            order = base_order if delta.order is None else delta.order
+            shifts = base_shifts if delta.version == delta.base_version else dict(base_shifts)
+            moved = [] if delta.order is None else set(base_order).symmetric_difference(delta.order)
+            self._track(moved, delta.upserts)
+
+        if delta.version != delta.base_version:
+            shifts.update((shift.link, shift) for shift in delta.upserts)
+            if delta.order is not None:
+                links = {link for link, _ in order}
+                shifts = {link: shift for link, shift in shifts.items() if link in links}
+            self._pages[delta.page] = (delta.version, order, shifts)
+        return ShiftPage(page=delta.page, rows=[(shifts[link], liquidating) for link, liquidating in order],
+                         total=delta.total)
+
+    def forget(self, page: int) -> None:
+        snapshot = self._pages.pop(page, None)
+        if snapshot is not None:
+            self._track(snapshot[1], [])
+
+    # Starts tracking afresh once the caller has compared against everything applied so far. Without
+    # pages there is nothing the next deltas could be compared to, so tracking stays off.
+    def acknowledge(self) -> None:
+        self.changed_links = set() if self._pages else None
+
+    def reset(self) -> None:
+        self._pages.clear()
+        self.changed_links = None
+
+    def _track(self, order: Iterable[tuple[int, bool]], upserts: list[ShiftBase]) -> None:
+        if self.changed_links is not None:
+            self.changed_links.update(link for link, _ in order)
+            self.changed_links.update(shift.link for shift in upserts)
@@ -1,13 +1,47 @@
-from datetime import datetime, timedelta
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import json
 import re
+from typing import Any
+from zoneinfo import ZoneInfo
 
-from ..schemas.shift import ShiftBase
+from bs4 import BeautifulSoup
+
+from ..constants import (
+    BOARD_TIMEZONE,
+    COMPANY_NAME_SELECTOR,
+    MAX_SHIFT_PAGES,
+    PAGINATION_CAPTION_SELECTOR,
+    SHIFTS_PAGE_LIMIT,
+    XHR_CONNECTED_KEYS,
+    XHR_FIELD_ALIASES,
+    XHR_LIST_KEYS,
+    XHR_TOTAL_KEYS
+)
+from ..schemas.shift import ShiftBase, ShiftPage
+
+DATE_PATTERN = re.compile(r'(\d+)\.\s*(\d+)\.\s*(\d{4})')
+OVERNIGHT_TIME_RANGE_PATTERN = re.compile(r'(\d{1,2}):(\d{2})\s*-\s*(\d{1,2})\.\s*(\d+)\.\s*(\d{1,2}):(\d{2})')
+TIME_RANGE_PATTERN = re.compile(r'(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})')
+TIME_RANGE_PREFIX_PATTERN = re.compile(r'\d{1,2}:\d{2}\s*-\s*\d{1,2}')
+OCCUPANCY_PATTERN = re.compile(r'(\d+)/(\d+)')
+TOTAL_COUNT_PATTERN = re.compile(r'\d+\s*[-–]\s*\d+\s*\D+?\s*(\d+)')
+# Two full boards worth of rows, so an unchanged board is served from the cache entirely
+ROW_CACHE_SIZE = 2 * SHIFTS_PAGE_LIMIT * MAX_SHIFT_PAGES
+BOARD_ZONE = ZoneInfo(BOARD_TIMEZONE)
 
 
 class ShiftConverter:
 
     @staticmethod
-    def parse_shift_data(shift_data: list[str]) -> ShiftBase | None:
+    def parse_shift_data(shift_data: list[str], link: int | None = None) -> ShiftBase | None:
+        # Most rows are identical to the previous scrape, and shifts are immutable, so parsed rows are shared
+        return ShiftConverter._parse_shift_row(tuple(shift_data), link)
+
+    @staticmethod
+    @lru_cache(maxsize=ROW_CACHE_SIZE)
+    def _parse_shift_row(shift_data: tuple[str, ...], link: int | None) -> ShiftBase | None:
         try:
             if len(shift_data) < 7:
                 raise ValueError(f"Недостаточно данных для создания смены: {shift_data}")
@@ -28,11 +62,149 @@ class ShiftConverter:
                 location=location,
                 position=position,
                 occupied=occupied,
-                max_occupy=max_occupy
+                max_occupy=max_occupy,
+                link=link
             )
         except Exception as e:
             return None
 
+    @staticmethod
+    def extract_rows_html(html: str) -> list[tuple[list[str], bool, str | None]]:
+        return ShiftConverter._extract_rows_soup(BeautifulSoup(html, "html.parser"))
+
+    @staticmethod
+    def _extract_rows_soup(soup: BeautifulSoup) -> list[tuple[list[str], bool, str | None]]:
+        rows = soup.select("tbody tr")
+
+        raw_rows = []
+        for i, r in enumerate(rows[:-1]):
+            classes = r.get("class", None)
+            if classes and "MuiTableRow-root" in classes and "MuiTableRow-hover" in classes:
+                text = [td.get_text(strip=True) for td in r.find_all(["td", "th"])]
+                if text:
+                    anchor = rows[i + 1].find("a")
+                    raw_rows.append((text, bool(r.select("svg.jss42.jss44")), anchor.get("href") if anchor else None))
+        return raw_rows
+
+    @staticmethod
+    def build_shift_rows(raw_rows: list[tuple[list[str], bool, str | None]]) -> list[tuple[ShiftBase, bool]]:
+        shift_rows = []
+        for text, liquidating, href in raw_rows:
+            link = ShiftConverter.parse_shift_link(href) if href else None
+            if not link:
+                continue
+            shift_schema = ShiftConverter.parse_shift_data(text, link)
+            if shift_schema:
+                shift_rows.append((shift_schema, liquidating))
+        return shift_rows
+
+    @staticmethod
+    def parse_shift_rows(html: str) -> list[tuple[ShiftBase, bool]]:
+        return ShiftConverter.build_shift_rows(ShiftConverter.extract_rows_html(html))
+
+    @staticmethod
+    def parse_extracted_rows(extracted_json: str, page: int) -> ShiftPage:
+        extracted = json.loads(extracted_json)
+        raw_rows = [(cells, bool(liquidating), href) for cells, liquidating, href in extracted['rows']]
+        return ShiftPage(
+            page=page,
+            rows=ShiftConverter.build_shift_rows(raw_rows),
+            total=ShiftConverter.parse_total_count(extracted['total'])
+        )
+
+    @staticmethod
+    def parse_shift_page(html: str, page: int) -> ShiftPage:
+        soup = BeautifulSoup(html, "html.parser")
+        captions = soup.select(PAGINATION_CAPTION_SELECTOR)
+        return ShiftPage(
+            page=page,
+            rows=ShiftConverter.build_shift_rows(ShiftConverter._extract_rows_soup(soup)),
+            total=ShiftConverter.parse_total_count("\n".join(caption.get_text() for caption in captions))
+        )
+
+    @staticmethod
+    def parse_company_name(html: str) -> str | None:
+        element = BeautifulSoup(html, "html.parser").select_one(COMPANY_NAME_SELECTOR)
+        return element.get_text(strip=True) if element else None
+
+    @staticmethod
+    def parse_shifts_payload(payload: Any) -> tuple[list[ShiftBase], int | None]:
+        items = ShiftConverter._json_value(payload, XHR_LIST_KEYS) if isinstance(payload, dict) else payload
+        if not isinstance(items, list):
+            return [], None
+        total = ShiftConverter._json_value(payload, XHR_TOTAL_KEYS) if isinstance(payload, dict) else None
+        shifts = [shift for shift in map(ShiftConverter.parse_shift_json, items) if shift]
+        return shifts, total if isinstance(total, int) else None
+
+    @staticmethod
+    def parse_shift_json(item: dict) -> ShiftBase | None:
+        if not isinstance(item, dict):
+            return None
+        try:
+            link = int(ShiftConverter._json_field(item, "link"))
+            start = ShiftConverter._parse_json_datetime(ShiftConverter._json_field(item, "start"))
+            end = ShiftConverter._parse_json_datetime(ShiftConverter._json_field(item, "end"))
+            occupied = ShiftConverter._json_field(item, "occupied")
+            max_occupy = ShiftConverter._json_field(item, "max_occupy")
+            if isinstance(occupied, str) and "/" in occupied:
+                occupied, max_occupy = ShiftConverter._parse_occupancy(occupied)
+        except (TypeError, ValueError):
+            return None
+
+        connected_items = ShiftConverter._json_value(item, XHR_CONNECTED_KEYS) or []
+        return ShiftBase(
+            name=ShiftConverter._json_text(ShiftConverter._json_field(item, "name")),
+            start=start,
+            end=end,
+            location=ShiftConverter._json_text(ShiftConverter._json_field(item, "location")),
+            company=ShiftConverter._json_text(ShiftConverter._json_field(item, "company")),
+            occupied=int(occupied) if occupied is not None else None,
+            max_occupy=int(max_occupy) if max_occupy is not None else None,
+            link=link,
+            position=ShiftConverter._json_text(ShiftConverter._json_field(item, "position")),
+            connected_shifts=[shift for shift in map(ShiftConverter.parse_shift_json, connected_items) if shift]
+        )
+
+    @staticmethod
+    def _json_value(item: dict, keys: list[str]) -> Any:
+        for key in keys:
+            if item.get(key) is not None:
+                return item[key]
+        return None
+
+    @staticmethod
+    def _json_field(item: dict, field_name: str) -> Any:
+        return ShiftConverter._json_value(item, XHR_FIELD_ALIASES[field_name])
+
+    @staticmethod
+    def _json_text(value: Any) -> str | None:
+        if isinstance(value, dict):
+            value = ShiftConverter._json_value(value, ["name", "title", "label"])
+        return value.strip() if isinstance(value, str) else None
+
+    @staticmethod
+    def _parse_json_datetime(value: Any) -> datetime:
+        # Naive Prague wall-clock times, like the ones parsed from the page, whatever the host's zone is
+        if isinstance(value, (int, float)):
+            # Epoch timestamps come in milliseconds from JavaScript
+            timestamp = value / 1000 if value > 10 ** 11 else value
+            return datetime.fromtimestamp(timestamp, timezone.utc).astimezone(BOARD_ZONE).replace(tzinfo=None)
+        if isinstance(value, str):
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            if parsed.tzinfo:
+                parsed = parsed.astimezone(BOARD_ZONE).replace(tzinfo=None)
+            return parsed
+        raise ValueError(f"Неверный формат даты: {value}")
+
+    @staticmethod
+    def parse_total_count(caption: str | None) -> int | None:
+        if not caption:
+            return None
+        total_match = TOTAL_COUNT_PATTERN.search(caption)
+        if not total_match:
+            return None
+        return int(total_match.group(1))
+
     @staticmethod
     def parse_shift_link(link: str) -> int | None:
         link_parts = link.split("/")
@@ -43,8 +215,9 @@ class ShiftConverter:
 
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _parse_datetime(date_str: str, time_range_str: str) -> tuple[datetime, datetime]:
-        date_match = re.search(r'(\d+)\.\s*(\d+)\.\s*(\d{4})', date_str)
+        date_match = DATE_PATTERN.search(date_str)
         if not date_match:
             raise ValueError(f"Неверный формат даты: {date_str}")
         
@@ -52,7 +225,7 @@ class ShiftConverter:
         month = int(date_match.group(2))
         year = int(date_match.group(3))
         
-        time_match = re.search(r'(\d{1,2}):(\d{2})\s*-\s*(\d{1,2})\.\s*(\d+)\.\s*(\d{1,2}):(\d{2})', time_range_str)
+        time_match = OVERNIGHT_TIME_RANGE_PATTERN.search(time_range_str)
         if time_match:
             start_hour = int(time_match.group(1))
             start_minute = int(time_match.group(2))
@@ -64,7 +237,7 @@ class ShiftConverter:
             start_datetime = datetime(year, month, day, start_hour, start_minute)
             end_datetime = datetime(year, end_month, end_day, end_hour, end_minute)
         else:
-            time_match = re.search(r'(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})', time_range_str)
+            time_match = TIME_RANGE_PATTERN.search(time_range_str)
             if not time_match:
                 raise ValueError(f"Неверный формат времени: {time_range_str}")
             
@@ -82,8 +255,9 @@ class ShiftConverter:
         return start_datetime, end_datetime
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _parse_occupancy(occupancy_str: str) -> tuple[int, int]:
-        occupancy_match = re.search(r'(\d+)/(\d+)', occupancy_str)
+        occupancy_match = OCCUPANCY_PATTERN.search(occupancy_str)
         if not occupancy_match:
             raise ValueError(f"Неверный формат занятости: {occupancy_str}")
         
@@ -92,6 +266,21 @@ class ShiftConverter:
         
         return occupied, max_occupy
 
+    @staticmethod
+    def cache_stats() -> dict[str, tuple[int, int]]:
+        return {
+            name: (cache.cache_info().hits, cache.cache_info().misses)
+            for name, cache in (("rows", ShiftConverter._parse_shift_row),
+                                ("datetimes", ShiftConverter._parse_datetime),
+                                ("occupancy", ShiftConverter._parse_occupancy))
+        }
+
+    @staticmethod
+    def clear_caches() -> None:
+        ShiftConverter._parse_shift_row.cache_clear()
+        ShiftConverter._parse_datetime.cache_clear()
+        ShiftConverter._parse_occupancy.cache_clear()
+
     @staticmethod
     def validate_shift_data(shift_data: list[str]) -> bool:
         try:
@@ -110,14 +299,40 @@ class ShiftConverter:
             if not shift_data[5].strip():
                 return False
             date_str = shift_data[1].strip()
-            if not re.search(r'\d+\.\s*\d+\.\s*\d{4}', date_str):
+            if not DATE_PATTERN.search(date_str):
                 return False
             time_str = shift_data[2].strip()
-            if not re.search(r'\d{1,2}:\d{2}\s*-\s*\d{1,2}', time_str):
+            if not TIME_RANGE_PREFIX_PATTERN.search(time_str):
                 return False
             occupancy_str = shift_data[5].strip()
-            if not re.search(r'\d+/\d+', occupancy_str):
+            if not OCCUPANCY_PATTERN.search(occupancy_str):
                 return False
             return True
         except:
             return False
+
+
+class ShiftCollector:
+
+    def __init__(self):
+        self._shifts: dict[int, ShiftBase] = dict()
+        self._connected: dict[int, list[ShiftBase]] = dict()
+        self._prev_link: int | None = None
+
+    def add_page(self, rows: list[tuple[ShiftBase, bool]]) -> int:
+        shift_cnt = len(self._shifts)
+        for shift, liquidating in rows:
+            if liquidating and self._prev_link is not None:
+                self._connected.setdefault(self._prev_link, []).append(shift)
+            elif shift.link not in self._shifts:
+                self._shifts[shift.link] = shift
+                self._prev_link = shift.link
+        return len(self._shifts) - shift_cnt
+
+    @property
+    def shifts(self) -> list[ShiftBase]:
+        return [
+            replace(shift, connected_shifts=shift.connected_shifts + tuple(self._connected[link]))
+            if link in self._connected else shift
+            for link, shift in self._shifts.items()
+        ]
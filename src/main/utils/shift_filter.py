@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from ..schemas.filter import FilterBase
+
+FilterSignature = tuple[bool, bool, frozenset[str], frozenset[str], frozenset[str], timedelta | None, timedelta | None]
+
+
+def filter_signature(shift_filter: FilterBase) -> FilterSignature:
+    return (
+        bool(shift_filter.is_black_list),
+        bool(shift_filter.is_and),
+        frozenset(company.value for company in shift_filter.companies),
+        frozenset(location.value for location in shift_filter.locations),
+        frozenset(position.value for position in shift_filter.positions),
+        shift_filter.longer or None,
+        shift_filter.shorter or None,
+    )
+
+
+SubscriptionSignature = frozenset[FilterSignature]
+
+
+# Users receive shifts passing all of their filters, so the order of the pair does not matter
+# and empty filters pass everything. Anything but the regular pair is not applied at all.
+def subscription_signature(signatures: list[FilterSignature]) -> SubscriptionSignature:
+    if len(signatures) != 2:
+        return frozenset()
+    return frozenset(signature for signature in signatures if any(signature[2:]))
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import math
+from typing import Awaitable, Callable
+
+from ..constants import MAX_SHIFT_PAGES, SHIFTS_PAGE_LIMIT
+from ..schemas.shift import ShiftBase, ShiftPage
+from .metrics import Metrics
+from .shift_converter import ShiftCollector
+
+
+class ShiftPaginator:
+    def __init__(self,
+                 page_limit: int = SHIFTS_PAGE_LIMIT,
+                 max_pages: int = MAX_SHIFT_PAGES,
+                 full_scan_interval: int = 6):
+        self.page_limit = page_limit
+        self.max_pages = max_pages
+        self.full_scan_interval = max(1, full_scan_interval)
+        self.metrics = Metrics("pagination")
+        self._known_links: set[int] = set()
+        self._known_shifts: dict[int, ShiftBase] = dict()
+        self._known_total: int | None = None
+        self._cycles = 0
+        self.begin()
+
+    def begin(self) -> None:
+        self._collector = ShiftCollector()
+        self._seen_links: set[int] = set()
+        self._rows_seen = 0
+        self._total: int | None = None
+        self._next_page = 1
+        self._pages_fetched = 0
+        self._done = False
+        self._stopped_early = False
+        self._full_scan = not self._known_links or self._cycles % self.full_scan_interval == 0
+
+    @property
+    def stopped_early(self) -> bool:
+        return self._stopped_early
+
+    @property
+    def next_page(self) -> int:
+        return self._next_page
+
+    def next_pages(self, concurrency: int = 1) -> list[int]:
+        if self._done:
+            return []
+        if self._next_page == 1:
+            return [1]
+        return list(range(self._next_page, min(self._next_page + max(1, concurrency), self._last_page() + 1)))
+
+    def add_pages(self, pages: list[ShiftPage]) -> None:
+        self._pages_fetched += len(pages)
+        for page in sorted(pages, key=lambda shift_page: shift_page.page):
+            if self._done:
+                return
+            self._next_page = max(self._next_page, page.page + 1)
+            if self._total is None:
+                self._total = page.total
+
+            added = self._collector.add_page(page.rows)
+            self._rows_seen += len(page.rows)
+            self._seen_links.update(shift.link for shift, _ in page.rows)
+
+            if not page.rows or (self._total is None and not added) or self._next_page > self._last_page():
+                self._done = True
+            elif self._can_stop_early():
+                self._done = True
+                self._stopped_early = True
+
+    def finish(self) -> list[ShiftBase]:
+        shifts = self._collector.shifts
+        if self._stopped_early:
+            seen_top_links = {shift.link for shift in shifts}
+            shifts.extend(
+                shift for link, shift in self._known_shifts.items()
+                if link not in seen_top_links and link not in self._seen_links
+            )
+            self.metrics.increment("early_stops")
+        else:
+            self._known_links = set(self._seen_links)
+
+        self._known_shifts = {shift.link: shift for shift in shifts}
+        self._known_total = self._total
+        self._cycles += 1
+
+        self.metrics.increment("cycles")
+        self.metrics.increment("pages", self._pages_fetched)
+        self.metrics.set_gauge("pages_last_cycle", self._pages_fetched)
+        logging.info(f"Fetched {self._pages_fetched} shift pages"
+                     f"{' (stopped early)' if self._stopped_early else ''}, total {self._total}")
+        return shifts
+
+    async def run(self, fetch_page: Callable[[int], Awaitable[ShiftPage]], concurrency: int = 1) -> list[ShiftBase]:
+        self.begin()
+        while pages := self.next_pages(concurrency):
+            self.add_pages(await asyncio.gather(*(fetch_page(page) for page in pages)))
+        return self.finish()
+
+    def _last_page(self) -> int:
+        if self._total is None:
+            return self.max_pages
+        return min(self.max_pages, max(1, math.ceil(self._total / self.page_limit)))
+
+    # With an unchanged total and nothing unknown seen so far, the remaining pages can only hold the
+    # known links that have not shown up yet. The periodic full scan catches a removal and an addition
+    # cancelling each other out in the tail.
+    def _can_stop_early(self) -> bool:
+        if self._full_scan or self._total is None or self._total != self._known_total:
+            return False
+        if not self._seen_links <= self._known_links:
+            return False
+        return len(self._known_links - self._seen_links) == self._total - self._rows_seen
@@ -0,0 +1,39 @@
+from typing import Any, Callable, NamedTuple
+
+from ..schemas.shift import ShiftBase
+from .metrics import Metrics
+
+
+class RenderedShift(NamedTuple):
+    text: str
+    keyboard: Any
+
+
+# Renders every distinct shift once and shares the text and markup between all recipients.
+# Shifts are keyed by link and fingerprint, so a shift that changed is rendered again.
+class ShiftRenderCache:
+
+    def __init__(self, formatter: Callable[[ShiftBase], str], keyboard: Callable[[int], Any]):
+        self._formatter = formatter
+        self._keyboard = keyboard
+        self._rendered: dict[tuple, RenderedShift] = dict()
+        self.metrics = Metrics("render")
+
+    def render(self, shift: ShiftBase, header: str | None = None) -> RenderedShift:
+        key = (shift.link, shift.fingerprint(), header)
+        rendered = self._rendered.get(key)
+        if rendered is not None:
+            self.metrics.increment("hits")
+            return rendered
+        self.metrics.increment("misses")
+        text = self._formatter(shift)
+        rendered = RenderedShift(text=f"{header}\n\n{text}" if header else text, keyboard=self._keyboard(shift.link))
+        self._rendered[key] = rendered
+        return rendered
+
+    def __len__(self) -> int:
+        return len(self._rendered)
+
+    def clear(self) -> None:
+        self._rendered.clear()
+        self.metrics.reset()
@@ -0,0 +1,111 @@
+from datetime import datetime
+from typing import NamedTuple
+
+from ..schemas.shift import ShiftBase
+from ..schemas.shift_event import ShiftEvent, ShiftEventType
+from .metrics import Metrics
+
+
+class ShiftFingerprint(NamedTuple):
+    start: datetime | None
+    end: datetime | None
+    occupied: int | None
+    max_occupy: int | None
+
+    @property
+    def free_seats(self) -> int | None:
+        if self.occupied is None or self.max_occupy is None:
+            return None
+        return self.max_occupy - self.occupied
+
+
+class SnapshotDiff(NamedTuple):
+    events: list[ShiftEvent]
+    fingerprints: dict[int, ShiftFingerprint]
+    # Set when only the changed links were compared, fingerprints then holds just those links
+    removed: set[int] | None = None
+
+
+class ShiftSnapshotStore:
+
+    def __init__(self):
+        self._fingerprints: dict[int, ShiftFingerprint] = dict()
+        self.metrics = Metrics("snapshot")
+
+    @property
+    def is_primed(self) -> bool:
+        return bool(self._fingerprints)
+
+    def update(self, shifts: list[ShiftBase]) -> list[ShiftEvent]:
+        snapshot_diff = self.diff(shifts)
+        self.commit(snapshot_diff)
+        return snapshot_diff.events
+
+    # Computes the events against the current baseline without touching it, so a caller that fails
+    # to handle them can leave the baseline as is and see the same events on the next cycle.
+    # With changed_links, only those links are compared and every other shift is taken to be as in the
+    # baseline, so a cycle costs in proportion to what changed rather than to the size of the board.
+    def diff(self, shifts: list[ShiftBase], changed_links: set[int] | None = None) -> SnapshotDiff:
+        # The first snapshot after start or after an empty board is the baseline and produces no events
+        primed = self.is_primed
+        if changed_links is not None and primed:
+            return self._diff_changed(shifts, changed_links)
+
+        previous_fingerprints = self._fingerprints
+        fingerprints: dict[int, ShiftFingerprint] = dict()
+        events: list[ShiftEvent] = []
+
+        for shift in shifts:
+            fingerprint = ShiftFingerprint(shift.start, shift.end, shift.occupied, shift.max_occupy)
+            fingerprints[shift.link] = fingerprint
+            if primed:
+                self._compare(shift, fingerprint, previous_fingerprints.get(shift.link), events)
+
+        if len(fingerprints) != len(previous_fingerprints) or events:
+            events.extend(
+                ShiftEvent(ShiftEventType.REMOVED, link) for link in previous_fingerprints.keys() - fingerprints.keys()
+            )
+        return SnapshotDiff(events, fingerprints)
+
+    def _diff_changed(self, shifts: list[ShiftBase], changed_links: set[int]) -> SnapshotDiff:
+        fingerprints: dict[int, ShiftFingerprint] = dict()
+        events: list[ShiftEvent] = []
+        if not changed_links:
+            return SnapshotDiff(events, fingerprints, set())
+
+        for shift in shifts:
+            if shift.link in changed_links:
+                fingerprint = ShiftFingerprint(shift.start, shift.end, shift.occupied, shift.max_occupy)
+                fingerprints[shift.link] = fingerprint
+                self._compare(shift, fingerprint, self._fingerprints.get(shift.link), events)
+
+        removed = {link for link in changed_links if link not in fingerprints and link in self._fingerprints}
+        events.extend(ShiftEvent(ShiftEventType.REMOVED, link) for link in removed)
+        return SnapshotDiff(events, fingerprints, removed)
+
+    @staticmethod
+    def _compare(shift: ShiftBase,
+                 fingerprint: ShiftFingerprint,
+                 previous: ShiftFingerprint | None,
+                 events: list[ShiftEvent]) -> None:
+        if previous is None:
+            events.append(ShiftEvent(ShiftEventType.NEW, shift.link, shift))
+        elif previous != fingerprint:
+            if previous.start != fingerprint.start or previous.end != fingerprint.end:
+                events.append(ShiftEvent(ShiftEventType.RESCHEDULED, shift.link, shift))
+            free_seats = fingerprint.free_seats
+            if free_seats is not None and previous.free_seats is not None and free_seats > previous.free_seats:
+                events.append(
+                    ShiftEvent(ShiftEventType.SEATS_FREED, shift.link, shift, previous_occupied=previous.occupied)
+                )
+
+    def commit(self, snapshot_diff: SnapshotDiff) -> None:
+        if snapshot_diff.removed is None:
+            self._fingerprints = snapshot_diff.fingerprints
+        else:
+            self._fingerprints.update(snapshot_diff.fingerprints)
+            for link in snapshot_diff.removed:
+                del self._fingerprints[link]
+        for event in snapshot_diff.events:
+            self.metrics.increment(event.type.value)
+        self.metrics.set_gauge("shifts", len(self._fingerprints))
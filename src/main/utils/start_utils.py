@@ -12,8 +12,9 @@ from dotenv import load_dotenv
 from src.main.utils.db_helper import DatabaseHelper
 from src.main.dao import UserDAO, FilterDAO
 from src.main.handlers import base_router, filter_router, admin_router
-from src.main.services import UserService, MessageService, ShiftService, MuteService
-from src.main.clients import SeleniumClient
+from src.main.services import UserService, MessageService, ShiftService, MuteService, CompanyCacheService, OutboxService
+from src.main.clients import SeleniumClient, HttpShiftClient
+from src.main.clients.selenium_client import get_blocked_url_patterns
 
 bot_instance = None
 shift_service_instance = None
@@ -47,11 +48,10 @@ async def graceful_shutdown():
     logging.info("Starting graceful shutdown...")
     
     try:
-        # Останавливаем ShiftService
-        if shift_service_instance:
-            logging.info("Stopping ShiftService...")
-            # Здесь можно добавить логику остановки ShiftService
-            logging.info("ShiftService stopped")
+        # Останавливаем ShiftService и доставляем оставшиеся сообщения
+        logging.info("Stopping services...")
+        await stop_services()
+        logging.info("Services stopped")
         
         # Останавливаем бота
         if bot_instance:
@@ -66,6 +66,20 @@ async def graceful_shutdown():
         sys.exit(0)
 
 
+async def stop_services() -> None:
+    """Остановка сервисов: сначала поиск смен и outbox, затем доставка уже поставленных в очередь сообщений"""
+    if shift_service_instance:
+        await shift_service_instance.stop()
+    try:
+        outbox_service = OutboxService.get_instance()
+        message_service = MessageService.get_instance()
+    except RuntimeError:
+        # Запуск упал до инициализации сервисов
+        return
+    await outbox_service.stop()
+    await message_service.close()
+
+
 class ServiceInitializer:
 
     @staticmethod
@@ -86,7 +100,32 @@ class ServiceInitializer:
         password = os.getenv("SELENIUM_PASSWORD")
         if not login or not password:
             raise RuntimeError("SELENIUM_LOGIN and SELENIUM_PASSWORD must be set in environment")
-        selenium_client = SeleniumClient(login, password)
+        pool_size = int(os.getenv("SELENIUM_POOL_SIZE", "1"))
+        fetch_mode = os.getenv("SHIFT_FETCH_MODE", "selenium")
+        http_client = HttpShiftClient() if fetch_mode == "http" else None
+        warm_standby = os.getenv("SELENIUM_WARM_STANDBY", "true").lower() == "true"
+        blocked_urls = os.getenv("SELENIUM_BLOCKED_URLS")
+        allowed_urls = os.getenv("SELENIUM_ALLOWED_URLS")
+        worker_options = {
+            # The file holds live session cookies, so persisting them is opt-in
+            "cookies_path": os.getenv("SELENIUM_COOKIES_PATH") or None,
+            "capture_xhr": os.getenv("SELENIUM_CAPTURE_XHR", "false").lower() == "true",
+            "capture_dir": os.getenv("SELENIUM_CAPTURE_DIR") or None,
+            "blocked_url_patterns": get_blocked_url_patterns(
+                blocked_urls.split(",") if blocked_urls is not None else None,
+                allowed_urls.split(",") if allowed_urls else None
+            ),
+        }
+        if os.getenv("SELENIUM_XHR_URL_PATTERN"):
+            worker_options["xhr_url_pattern"] = os.getenv("SELENIUM_XHR_URL_PATTERN")
+        selenium_client = SeleniumClient(login, password,
+                                         pool_size=pool_size,
+                                         http_client=http_client,
+                                         warm_standby=warm_standby,
+                                         worker_options=worker_options,
+                                         watch_mode=fetch_mode == "watch",
+                                         watch_reload_interval=int(os.getenv("SHIFT_WATCH_RELOAD_INTERVAL", "60")),
+                                         watch_max_pages=int(os.getenv("SHIFT_WATCH_MAX_PAGES", "1")))
         return selenium_client
 
     @staticmethod
@@ -96,9 +135,18 @@ class ServiceInitializer:
         user_dao = UserDAO(db_helper)
         filter_dao = FilterDAO(db_helper)
         UserService.initialize(user_dao, filter_dao)
-        MessageService.initialize(user_dao)
-        ShiftService.initialize(user_dao, filter_dao, selenium_client)
+        MessageService.initialize(user_dao, dispatcher_options={
+            "concurrency": int(os.getenv("TELEGRAM_SEND_CONCURRENCY", "8")),
+            "global_rate": float(os.getenv("TELEGRAM_GLOBAL_RATE", "25")),
+            "chat_rate": float(os.getenv("TELEGRAM_CHAT_RATE", "1")),
+        })
+        ShiftService.initialize(user_dao, filter_dao, selenium_client,
+                                notify_seats_freed=os.getenv("SHIFT_NOTIFY_SEATS_FREED", "false").lower() == "true")
         MuteService.initialize(db_helper)
+        CompanyCacheService.initialize(db_helper)
+        OutboxService.initialize(db_helper,
+                                 workers=int(os.getenv("OUTBOX_WORKERS", "2")),
+                                 batch_size=int(os.getenv("OUTBOX_BATCH_SIZE", "25")))
 
 
 
@@ -149,6 +197,9 @@ async def run_bot() -> None:
         
         logging.info("Starting ShiftService...")
         await shift_service.run()
+
+        logging.info("Starting outbox delivery workers...")
+        await OutboxService.get_instance().run()
         
         logging.info("Starting bot polling...")
         await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
@@ -157,6 +208,7 @@ async def run_bot() -> None:
         logging.error(f"Error in run_bot: {e}")
         raise
     finally:
+        await stop_services()
         logging.info("run_bot() completed")
 
 
@@ -0,0 +1,169 @@
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from enum import Enum
+
+from ..schemas.filter import FilterBase
+from ..schemas.shift import ShiftBase
+from .shift_filter import FilterSignature, SubscriptionSignature, filter_signature, subscription_signature
+
+
+class FilterKind(Enum):
+    EMPTY = "empty"
+    WHITE_AND = "white_and"
+    WHITE_OR = "white_or"
+    BLACK_AND = "black_and"
+    BLACK_OR = "black_or"
+
+
+BLACK_KINDS = (FilterKind.BLACK_AND, FilterKind.BLACK_OR)
+
+
+# Number of conditions a filter sets; a shift satisfies each of them at most once
+def condition_count(signature: FilterSignature) -> int:
+    return sum(bool(condition) for condition in signature[2:])
+
+
+def filter_kind(signature: FilterSignature) -> FilterKind:
+    is_black_list, is_and = signature[:2]
+    if not condition_count(signature):
+        return FilterKind.EMPTY
+    if is_black_list:
+        return FilterKind.BLACK_AND if is_and else FilterKind.BLACK_OR
+    return FilterKind.WHITE_AND if is_and else FilterKind.WHITE_OR
+
+
+# Postings map every company, location and position to the filters naming it, and duration bounds
+# are kept sorted, so matching a shift only touches the filters whose conditions it satisfies.
+# Whitelists pass only through postings and blacklists fail only through postings, so the work per
+# shift grows with the number of matching subscribers rather than with the number of subscribers.
+# Users with equivalent filters share a group that is indexed and matched once.
+class SubscriptionIndex:
+
+    # signature_cache maps filter ids to (version, signature) and is meant to outlive the index, so a
+    # filter is only turned into a signature again once its version changes
+    def __init__(self,
+                 user_filters: dict[int, list[FilterBase]],
+                 signature_cache: dict[int, tuple[int, FilterSignature]] | None = None):
+        self._signature_cache = signature_cache
+        self._kinds: list[FilterKind] = []
+        self._threshold: list[int] = []
+        self._is_black: list[bool] = []
+        self._filter_group: list[int] = []
+        self._white_count: list[int] = []
+        self._groups: list[list[int]] = []
+        self._default_groups: set[int] = set()
+        self._companies: dict[str, list[int]] = defaultdict(list)
+        self._locations: dict[str, list[int]] = defaultdict(list)
+        self._positions: dict[str, list[int]] = defaultdict(list)
+        longer: list[tuple] = []
+        shorter: list[tuple] = []
+
+        group_ids: dict[SubscriptionSignature, int] = dict()
+        for user_id, filters in user_filters.items():
+            subscription = subscription_signature([self._filter_signature(shift_filter) for shift_filter in filters])
+            if subscription in group_ids:
+                self._groups[group_ids[subscription]].append(user_id)
+                continue
+            group_id = group_ids[subscription] = len(self._groups)
+            self._groups.append([user_id])
+            white_count = 0
+            for signature in subscription:
+                kind = filter_kind(signature)
+                filter_id = len(self._kinds)
+                self._kinds.append(kind)
+                is_black_list, is_and, companies, locations, positions, longer_bound, shorter_bound = signature
+                self._threshold.append(condition_count(signature) if is_and else 1)
+                self._is_black.append(is_black_list)
+                self._filter_group.append(group_id)
+                white_count += kind not in BLACK_KINDS
+                for company in companies:
+                    self._companies[company].append(filter_id)
+                for location in locations:
+                    self._locations[location].append(filter_id)
+                for position in positions:
+                    self._positions[position].append(filter_id)
+                if longer_bound:
+                    longer.append((longer_bound, filter_id))
+                if shorter_bound:
+                    shorter.append((shorter_bound, filter_id))
+            self._white_count.append(white_count)
+            if not white_count:
+                self._default_groups.add(group_id)
+
+        longer.sort()
+        shorter.sort()
+        self._longer_bounds = [bound for bound, _ in longer]
+        self._longer_filters = [filter_id for _, filter_id in longer]
+        self._shorter_bounds = [bound for bound, _ in shorter]
+        self._shorter_filters = [filter_id for _, filter_id in shorter]
+
+    def _filter_signature(self, shift_filter: FilterBase) -> FilterSignature:
+        if self._signature_cache is None or shift_filter.id is None:
+            return filter_signature(shift_filter)
+        cached = self._signature_cache.get(shift_filter.id)
+        if cached is not None and cached[0] == shift_filter.version:
+            return cached[1]
+        signature = filter_signature(shift_filter)
+        self._signature_cache[shift_filter.id] = (shift_filter.version, signature)
+        return signature
+
+    @property
+    def user_count(self) -> int:
+        return sum(map(len, self._groups))
+
+    @property
+    def group_count(self) -> int:
+        return len(self._groups)
+
+    def _satisfied_conditions(self, shift: ShiftBase) -> Counter:
+        counts = Counter(self._locations.get(shift.location, ()))
+        counts.update(self._positions.get(shift.position, ()))
+        if shift.company:
+            counts.update(self._companies.get(shift.company, ()))
+        if self._longer_bounds or self._shorter_bounds:
+            duration = shift.end - shift.start
+            counts.update(self._longer_filters[:bisect_left(self._longer_bounds, duration)])
+            counts.update(self._shorter_filters[bisect_right(self._shorter_bounds, duration):])
+        return counts
+
+    # A whitelist passes and a blacklist fails once its threshold of conditions is met:
+    # all of them for "and" filters, any of them for "or" filters
+    def _match_node(self, shift: ShiftBase) -> set[int]:
+        threshold, filter_group, is_black = self._threshold, self._filter_group, self._is_black
+        blocked = set()
+        white_passed: dict[int, int] = defaultdict(int)
+        for filter_id, count in self._satisfied_conditions(shift).items():
+            if count >= threshold[filter_id]:
+                if is_black[filter_id]:
+                    blocked.add(filter_group[filter_id])
+                else:
+                    white_passed[filter_group[filter_id]] += 1
+        white_count = self._white_count
+        groups = {group_id for group_id, count in white_passed.items() if count == white_count[group_id]}
+        groups |= self._default_groups
+        return groups - blocked
+
+    # A shift goes to a group only if the shift and every shift connected to it pass the group's filters
+    def _match_groups(self, shift: ShiftBase) -> set[int]:
+        groups = self._match_node(shift)
+        for c_shift in shift.connected_shifts:
+            if not groups:
+                break
+            groups &= self._match_groups(c_shift)
+        return groups
+
+    def match(self, shift: ShiftBase) -> set[int]:
+        return {user_id for group_id in self._match_groups(shift) for user_id in self._groups[group_id]}
+
+    # Shifts are immutable, so every user of a group shares one tuple of the same shift objects
+    def match_shifts(self, shift_list: list[ShiftBase]) -> dict[int, tuple[ShiftBase, ...]]:
+        group_shifts: dict[int, list[ShiftBase]] = defaultdict(list)
+        for shift in shift_list:
+            for group_id in self._match_groups(shift):
+                group_shifts[group_id].append(shift)
+        user_shifts: dict[int, tuple[ShiftBase, ...]] = dict()
+        for group_id, shifts in group_shifts.items():
+            shared = tuple(shifts)
+            for user_id in self._groups[group_id]:
+                user_shifts[user_id] = shared
+        return user_shifts